@@ -603,6 +603,14 @@ class MultiTrackPlayer:
             self._pos = min(max(0, frame), self._n_frames)
             self._frames_processed = self._pos
 
+    def get_callback_count(self) -> int:
+        """Number of audio callbacks processed so far (cheap; no stats math).
+
+        Lets pollers such as LatencyMonitor skip get_latency_stats() when no
+        new callback has run since their last read.
+        """
+        return self._total_callbacks
+
     def get_latency_stats(self) -> Dict[str, float]:
         """Get audio callback latency statistics.
 
@@ -21,7 +21,7 @@ from pathlib import Path
 from typing import Optional
 
 from PySide6.QtCore import Qt, QThread, QTimer, Slot
-from PySide6.QtGui import QCloseEvent, QIcon
+from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import (QApplication, QMainWindow, QMessageBox,
                                QPushButton)
 
@@ -49,8 +49,8 @@ from ui.widgets.settings_dialog import SettingsDialog
 from ui.widgets.spinner_dialog import SpinnerDialog
 from ui.widgets.timeline_view import TimelineView, ZoomMode
 from ui.widgets.track_widget import TrackWidget
-from utils.helpers import (clear_layout, get_logarithmic_volume, get_mp4,
-                           get_tracks)
+from utils.helpers import (clear_layout, get_icon, get_logarithmic_volume,
+                           get_mp4, get_tracks)
 from utils.lyrics_loader import LyricsLoader
 from video.background_manager import BackgroundManager
 from video.video import VisualController
@@ -69,7 +69,7 @@ class MainWindow(QMainWindow):
         #Agregar plus buttom
         self.plus_btn = QPushButton()
         self.plus_btn.setFixedSize(50, 100)
-        self.plus_btn.setIcon(QIcon("assets/img/plus-circle.svg"))
+        self.plus_btn.setIcon(get_icon("assets/img/plus-circle.svg"))
         self.plus_btn.setIconSize(self.plus_btn.size()  * 0.7)
 
         self.ui.playlist_layout.addWidget(self.plus_btn)
@@ -210,8 +210,7 @@ class MainWindow(QMainWindow):
             lambda seconds: self.playback.request_seek(seconds, self.video_offset)
         )
 
-        self.controls.play_clicked.connect(self.on_play_clicked)
-        self.controls.pause_clicked.connect(self.on_pause_clicked)
+        self.controls.play_toggled.connect(self._on_play_toggled)
         self.controls.edit_mode_toggled.connect(self.on_edit_mode_toggled)
 
         # Connect show_video_btn to control video window visibility
@@ -280,7 +279,7 @@ class MainWindow(QMainWindow):
         # Crear diálogo bajo demanda con parent para centrarlo automáticamente
         add_dialog = AddDialog(parent=self)
         add_dialog.search_widget.multi_selected.connect(self.on_multi_selected)
-        add_dialog.drop_widget.file_imported.connect(self.extraction_process)
+        add_dialog.file_imported.connect(self.extraction_process)
         add_dialog.exec()
 
     @Slot()
@@ -299,6 +298,14 @@ class MainWindow(QMainWindow):
         self.latency_monitor.setVisible(visible)
         logger.info(f"🎛️  Latency monitor: {'shown' if visible else 'hidden'}")
 
+    @Slot(bool)
+    def _on_play_toggled(self, checked: bool) -> None:
+        """Play/resume when the toggle is checked, pause when unchecked."""
+        if checked:
+            self.on_play_clicked()
+        else:
+            self.on_pause_clicked()
+
     @Slot()
     def on_play_clicked(self) -> None:
         # CRITICAL: Start position polling timer BEFORE starting audio
@@ -360,33 +367,21 @@ class MainWindow(QMainWindow):
             else:
                 self.timeline_view.set_zoom_mode(ZoomMode.GENERAL, auto=True)
 
-    @Slot(str)
-    def on_zoom_mode_changed(self, mode: str) -> None:
+    @Slot(object)
+    def on_zoom_mode_changed(self, mode: ZoomMode) -> None:
         """Handler para cuando el usuario cambia el modo desde la UI."""
-        zoom_mode_map = {
-            "GENERAL": ZoomMode.GENERAL,
-            "PLAYBACK": ZoomMode.PLAYBACK,
-            "EDIT": ZoomMode.EDIT
-        }
-        if mode in zoom_mode_map:
-            self.timeline_view.set_zoom_mode(zoom_mode_map[mode], auto=False)
+        self.timeline_view.set_zoom_mode(mode, auto=False)
 
     @Slot(object)
     def on_timeline_zoom_mode_changed(self, mode: ZoomMode) -> None:
         """Handler para cuando el timeline cambia de modo (actualizar UI y status bar)."""
-        mode_str_map = {
-            ZoomMode.GENERAL: "GENERAL",
-            ZoomMode.PLAYBACK: "PLAYBACK",
-            ZoomMode.EDIT: "EDIT"
-        }
         mode_display_names = {
             ZoomMode.GENERAL: "Vista General",
             ZoomMode.PLAYBACK: "Reproducción",
             ZoomMode.EDIT: "Edición"
         }
 
-        if mode in mode_str_map:
-            self.controls.set_zoom_mode(mode_str_map[mode])
+        self.controls.set_zoom_mode(mode)
 
         # Update status bar with zoom mode
         if mode in mode_display_names:
@@ -443,7 +438,7 @@ class MainWindow(QMainWindow):
 
         # Restablecer botón a estado inicial
         self.controls.show_video_btn.setChecked(False)
-        self.controls.show_video_btn.setIcon(QIcon("assets/img/chromecast.svg"))
+        self.controls.show_video_btn.setIcon(get_icon("assets/img/chromecast.svg"))
         self.controls.show_video_btn.setToolTip("click para proyectar video")
 
         # Desbloquear señales
@@ -953,9 +948,13 @@ if __name__ == "__main__":
             sys.exit(1)
 
     app = QApplication(sys.argv)
+    # Nombres de la app: QStandardPaths los usa para las rutas de caché/config
+    app.setOrganizationName("MultiLyrics")
+    app.setApplicationName("MultiLyrics")
     # Asegura que los iconos y gráficos no se vean pixelados en pantallas 4K/Retina.
     app.setAttribute(Qt.AA_UseHighDpiPixmaps)
 
+    # Tema antes de crear widgets: evita un segundo polish de todo el árbol
     StyleManager.setup_theme(app)
     window = MainWindow()
     window.show()
@@ -0,0 +1,61 @@
+"""
+Unit tests para AddDialog (navegación entre páginas)
+"""
+
+import pytest
+from PySide6.QtWidgets import QApplication
+from ui.widgets.add import AddDialog
+
+
+@pytest.fixture(scope='module')
+def qapp():
+    """Fixture para QApplication (requerido por Qt)"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+class TestAddDialogNavigation:
+    """Tests para nextWidget/previousWidget"""
+
+    def test_next_wraps_around(self, qapp):
+        """Crear avanza y vuelve a la primera página"""
+        dialog = AddDialog()
+
+        dialog.nextWidget()
+        assert dialog.stackedWidget.currentIndex() == 1
+        dialog.nextWidget()
+        assert dialog.stackedWidget.currentIndex() == 0
+
+    def test_previous_wraps_to_last_page(self, qapp):
+        """Buscar desde la primera página va a la última (antes: índice 2 inválido)"""
+        dialog = AddDialog()
+
+        dialog.previousWidget()
+        assert dialog.stackedWidget.currentIndex() == dialog.stackedWidget.count() - 1
+
+    def test_drop_page_built_on_first_visit(self, qapp):
+        """DropWidget se crea al mostrarse y su señal llega al diálogo"""
+        dialog = AddDialog()
+        assert dialog.drop_widget is None
+
+        dialog.nextWidget()
+        assert dialog.stackedWidget.currentWidget() is dialog.drop_widget
+        assert dialog.stackedWidget.count() == 2
+
+        received = []
+        dialog.file_imported.connect(received.append)
+        dialog.drop_widget.file_imported.emit("/tmp/song.mp4")
+        assert received == ["/tmp/song.mp4"]
+
+    def test_copy_finished_after_close_is_ignored(self, qapp):
+        """Una copia que termina con el diálogo ya cerrado no emite file_imported"""
+        dialog = AddDialog()
+        dialog.nextWidget()
+
+        received = []
+        dialog.file_imported.connect(received.append)
+        dialog.reject()
+        dialog.drop_widget.file_imported.emit("/tmp/song.mp4")
+        assert received == []
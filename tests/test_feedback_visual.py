@@ -113,3 +113,29 @@ class TestToastNotification:
         assert info_toast is not None
         assert warning_toast is not None
         assert error_toast is not None
+
+
+class TestMessageBoxes:
+    """Test suite for modal QMessageBox helpers"""
+
+    def test_nested_message_gets_its_own_box(self, main_window, monkeypatch):
+        """A message opened while another is in exec() does not reuse it"""
+        from PySide6.QtWidgets import QMessageBox
+
+        seen = []
+        answers = []
+
+        def fake_exec(box):
+            seen.append(box)
+            if len(seen) == 1:
+                # Slot running in the outer box's nested event loop
+                answers.append(message_helpers.show_question(main_window, "Q", "Continue?"))
+                assert box.text() == "Outer error"
+            return QMessageBox.Yes
+
+        monkeypatch.setattr(QMessageBox, "exec", fake_exec)
+        message_helpers.show_error(main_window, "Error", "Outer error")
+
+        assert len(seen) == 2
+        assert seen[0] is not seen[1]
+        assert answers == [True]
@@ -2,11 +2,14 @@
 Tests for LyricsSearchDialog - unified lyrics search interface.
 """
 
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 
+from ui.styles import StyleManager
 from ui.widgets.lyrics_search_dialog import LyricsSearchDialog
 
 
@@ -142,7 +145,7 @@ class TestLyricsSearchDialog:
         assert "No se encontraron letras sincronizadas" in dialog.info_label.text()
         assert not dialog.download_btn.isEnabled()
     
-    def test_manual_search(self, qapp, sample_metadata, sample_results, mock_lyrics_loader):
+    def test_manual_search(self, qapp, qtbot, sample_metadata, sample_results, mock_lyrics_loader):
         """Test manual search button triggers search with updated metadata"""
         mock_lyrics_loader.search_all.return_value = sample_results
         
@@ -156,14 +159,73 @@ class TestLyricsSearchDialog:
         dialog.track_input.setText("New Track")
         dialog.artist_input.setText("New Artist")
         
-        # Click search
+        # Click search (runs on a pool thread)
         dialog.search_btn.click()
-        
+        assert not dialog.search_btn.isEnabled()
+
+        # Results should be updated once the worker reports back
+        qtbot.waitUntil(lambda: dialog.results_list.count() == 2, timeout=2000)
+        assert dialog.search_btn.isEnabled()
+
         # Verify search was called with new metadata
         mock_lyrics_loader.search_all.assert_called_once_with("New Track", "New Artist")
-        
-        # Results should be updated
+
+    def test_repeated_search_uses_cache(self, qapp, qtbot, sample_metadata, sample_results, mock_lyrics_loader):
+        """Test searching the same track/artist again skips the network call"""
+        mock_lyrics_loader.search_all.return_value = sample_results
+
+        dialog = LyricsSearchDialog(sample_metadata, [], mock_lyrics_loader)
+        dialog.search_btn.click()
+        qtbot.waitUntil(dialog.search_btn.isEnabled, timeout=2000)
+
+        # Same query, different case: served from the cache synchronously
+        dialog.track_input.setText("test song")
+        dialog.search_btn.click()
+
+        assert mock_lyrics_loader.search_all.call_count == 1
         assert dialog.results_list.count() == 2
+
+    def test_empty_search_not_cached(self, qapp, qtbot, sample_metadata, sample_results, mock_lyrics_loader):
+        """Test an offline search (loader returns []) is retried once the network is back"""
+        mock_lyrics_loader.search_all.side_effect = [[], sample_results]
+
+        dialog = LyricsSearchDialog(sample_metadata, [], mock_lyrics_loader)
+        dialog.search_btn.click()
+        qtbot.waitUntil(dialog.search_btn.isEnabled, timeout=2000)
+        assert dialog.results_list.count() == 0
+
+        dialog.search_btn.click()
+        qtbot.waitUntil(lambda: dialog.results_list.count() == 2, timeout=2000)
+        assert mock_lyrics_loader.search_all.call_count == 2
+
+    def test_manual_search_error_shown(self, qapp, qtbot, sample_metadata, mock_lyrics_loader):
+        """Test a failing search reports the error and re-enables the button"""
+        mock_lyrics_loader.search_all.side_effect = RuntimeError("timeout")
+
+        dialog = LyricsSearchDialog(sample_metadata, [], mock_lyrics_loader)
+        dialog.search_btn.click()
+
+        qtbot.waitUntil(dialog.search_btn.isEnabled, timeout=2000)
+        assert "timeout" in dialog.info_label.text()
+
+    def test_search_results_ignored_after_close(self, qapp, qtbot, sample_metadata, sample_results, mock_lyrics_loader):
+        """Test results arriving after the dialog closed are discarded"""
+        release = threading.Event()
+
+        def slow_search(track_name, artist_name):
+            release.wait(2)
+            return sample_results
+        mock_lyrics_loader.search_all.side_effect = slow_search
+
+        dialog = LyricsSearchDialog(sample_metadata, [], mock_lyrics_loader)
+        dialog.search_btn.click()
+
+        with qtbot.waitSignal(dialog._search_worker.signals.finished, timeout=2000):
+            dialog.reject()
+            release.set()
+        qapp.processEvents()
+
+        assert dialog.results_list.count() == 0
     
     def test_result_selection_enables_download(self, qapp, sample_metadata, sample_results, mock_lyrics_loader):
         """Test selecting a result enables download button"""
@@ -285,3 +347,12 @@ class TestLyricsSearchDialog:
         # Should NOT call search - shows warning instead
         mock_lyrics_loader.search_all.assert_not_called()
         assert "Por favor ingresa" in dialog.info_label.text()
+    
+    def test_stylesheet_shared_between_dialogs(self, qapp, sample_metadata, mock_lyrics_loader):
+        """Test stylesheet is built once and uses palette color strings"""
+        first = LyricsSearchDialog(sample_metadata, [], mock_lyrics_loader)
+        second = LyricsSearchDialog(sample_metadata, [], mock_lyrics_loader)
+        
+        assert first.styleSheet() == second.styleSheet()
+        assert "QColor" not in first.styleSheet()
+        assert StyleManager.PALETTE['accent'] in first.styleSheet()
@@ -5,6 +5,8 @@ from core.playback_manager import PlaybackManager
 
 
 class DummySignal:
+    __slots__ = ('_connected',)
+
     def __init__(self):
         self._connected = None
     def connect(self, fn):
@@ -12,6 +14,8 @@ class DummySignal:
 
 
 class DummySync:
+    __slots__ = ('set_audio_time_called_with', 'audioTimeUpdated')
+
     def __init__(self):
         self.set_audio_time_called_with = None
         self.audioTimeUpdated = DummySignal()
@@ -30,7 +34,16 @@ def playback(sync):
     return PlaybackManager(sync)
 
 
-def test_request_seek_calls_players_and_sync(playback):
+@pytest.mark.parametrize(
+    "requested, expected, duration",
+    [
+        (4.2, 4.2, None),     # plain seek
+        (12.3, 5.0, 5.0),     # beyond duration -> clamped
+        (-3.5, 0.0, None),    # negative -> clamped to 0
+    ],
+    ids=["calls_players_and_sync", "clamps_to_duration", "handles_negative_values"],
+)
+def test_request_seek(playback, requested, expected, duration):
     mock_audio = Mock()
     mock_audio.is_playing.return_value = False  # allow seek
     mock_video = Mock()
@@ -39,57 +52,19 @@ def test_request_seek_calls_players_and_sync(playback):
     playback.set_audio_player(mock_audio)
     playback.set_video_player(mock_video)
     playback.set_timeline(mock_timeline)
+    if duration is not None:
+        playback.set_duration(duration)
 
     # No longer testing positionChanged signal - it was removed
-    # Instead verify timeline model gets updated
-
-    playback.request_seek(4.2)
-
-    mock_audio.seek_seconds.assert_called_once_with(4.2)
-    mock_video.seek_seconds.assert_called_once_with(4.2)
-    assert playback.sync.set_audio_time_called_with == 4.2
-    mock_timeline.set_playhead_time.assert_called_once_with(4.2)
-
-
-def test_request_seek_clamps_to_duration(playback):
-    mock_audio = Mock()
-    mock_audio.is_playing.return_value = False  # allow seek
-    mock_video = Mock()
-    mock_timeline = Mock()
-
-    playback.set_audio_player(mock_audio)
-    playback.set_video_player(mock_video)
-    playback.set_timeline(mock_timeline)
-    playback.set_duration(5.0)
-
-    # Verify timeline gets clamped value instead of signal
-
-    playback.request_seek(12.3)  # beyond duration
-
-    mock_audio.seek_seconds.assert_called_once_with(5.0)
-    mock_video.seek_seconds.assert_called_once_with(5.0)
-    assert playback.sync.set_audio_time_called_with == 5.0
-    mock_timeline.set_playhead_time.assert_called_once_with(5.0)
-
-
-def test_request_seek_handles_negative_values(playback):
-    mock_audio = Mock()
-    mock_audio.is_playing.return_value = False  # allow seek
-    mock_video = Mock()
-    mock_timeline = Mock()
-
-    playback.set_audio_player(mock_audio)
-    playback.set_video_player(mock_video)
-    playback.set_timeline(mock_timeline)
-
-    # Verify timeline gets clamped to 0
+    # Instead verify timeline model gets updated (with clamped value)
 
-    playback.request_seek(-3.5)
+    playback.request_seek(requested)
 
-    mock_audio.seek_seconds.assert_called_once_with(0.0)
-    mock_video.seek_seconds.assert_called_once_with(0.0)
-    assert playback.sync.set_audio_time_called_with == 0.0
-    mock_timeline.set_playhead_time.assert_called_once_with(0.0)
+    mock_audio.seek_seconds.assert_called_once_with(expected)
+    # Video is seeked through its active background strategy
+    mock_video.background.seek.assert_called_once_with(mock_video.engine, expected)
+    assert playback.sync.set_audio_time_called_with == expected
+    mock_timeline.set_playhead_time.assert_called_once_with(expected)
 
 
 def test_request_seek_tolerates_missing_players(playback):
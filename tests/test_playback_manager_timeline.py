@@ -3,6 +3,8 @@ from models.timeline_model import TimelineModel
 
 
 class FakeSignal:
+    __slots__ = ('_cb',)
+
     def __init__(self):
         self._cb = None
 
@@ -15,6 +17,8 @@ class FakeSignal:
 
 
 class FakeSync:
+    __slots__ = ('audioTimeUpdated', '_last_set_audio_time')
+
     def __init__(self):
         self.audioTimeUpdated = FakeSignal()
         self._last_set_audio_time = None
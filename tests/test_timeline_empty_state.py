@@ -26,6 +26,12 @@ def qapp():
     yield app
 
 
+@pytest.fixture
+def timeline_view(qapp):
+    """Fixture to provide an empty TimelineView instance"""
+    return TimelineView()
+
+
 @pytest.fixture
 def temp_audio_file():
     """Create a temporary audio file for testing"""
@@ -47,10 +53,8 @@ def temp_audio_file():
         temp_path.unlink(missing_ok=True)
 
 
-def test_timeline_starts_empty(qapp):
+def test_timeline_starts_empty(timeline_view):
     """Test that TimelineView initializes in empty state"""
-    timeline_view = TimelineView()
-
     # Verify empty state
     assert not timeline_view.has_audio_loaded()
     assert timeline_view.audio_data is None
@@ -62,16 +66,14 @@ def test_timeline_starts_empty(qapp):
     assert timeline_view.get_audio_info() is None
 
 
-def test_timeline_no_audio_path_parameter(qapp):
+def test_timeline_no_audio_path_parameter(timeline_view):
     """Test that TimelineView constructor doesn't require audio_path parameter"""
     # Should not raise any exception
-    timeline_view = TimelineView()
     assert timeline_view is not None
 
 
-def test_timeline_loads_audio_from_empty_state(qapp, temp_audio_file):
+def test_timeline_loads_audio_from_empty_state(timeline_view, temp_audio_file):
     """Test transition from empty state to loaded state"""
-    timeline_view = TimelineView()
     timeline_model = TimelineModel()
     timeline_view.set_timeline(timeline_model)
 
@@ -99,10 +101,8 @@ def test_timeline_loads_audio_from_empty_state(qapp, temp_audio_file):
     assert info['duration'] > 0
 
 
-def test_timeline_height_changes_on_load(qapp, temp_audio_file):
+def test_timeline_height_changes_on_load(timeline_view, temp_audio_file):
     """Test that minimum height changes from empty to loaded state"""
-    timeline_view = TimelineView()
-
     # Empty state has smaller height
     empty_height = timeline_view.minimumHeight()
     assert empty_height == 100
@@ -115,10 +115,8 @@ def test_timeline_height_changes_on_load(qapp, temp_audio_file):
     assert loaded_height == 200
 
 
-def test_timeline_handles_missing_file(qapp):
+def test_timeline_handles_missing_file(timeline_view):
     """Test that loading non-existent file doesn't crash"""
-    timeline_view = TimelineView()
-
     # Try to load non-existent file
     timeline_view.load_audio_from_master("/nonexistent/path/audio.wav")
 
@@ -127,10 +125,8 @@ def test_timeline_handles_missing_file(qapp):
     assert timeline_view.audio_data is None
 
 
-def test_timeline_resets_to_empty_on_error(qapp):
+def test_timeline_resets_to_empty_on_error(timeline_view):
     """Test that _reset_to_empty_state properly clears all state"""
-    timeline_view = TimelineView()
-
     # Manually set some state
     timeline_view.audio_data = np.array([1, 2, 3])
     timeline_view.audio_path = "some_path.wav"
@@ -148,9 +144,8 @@ def test_timeline_resets_to_empty_on_error(qapp):
     assert timeline_view.minimumHeight() == 100
 
 
-def test_timeline_view_state_reset(qapp, temp_audio_file):
+def test_timeline_view_state_reset(timeline_view, temp_audio_file):
     """Test that reset_view_state works after loading audio"""
-    timeline_view = TimelineView()
     timeline_model = TimelineModel()
     timeline_view.set_timeline(timeline_model)
 
@@ -170,3 +165,4 @@ def test_timeline_view_state_reset(qapp, temp_audio_file):
     assert timeline_view._user_zoom_override == False
     assert timeline_view._lyrics_edit_mode == False
     assert timeline_view.has_audio_loaded()  # Audio should still be loaded
+
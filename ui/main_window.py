@@ -31,7 +31,6 @@ class Ui_MainWindow(object):
         self.central_widget_layout.setContentsMargins(0, 0, 0, 0)
         self.frame_playlist = QFrame(self.central_widget)
         self.frame_playlist.setObjectName(u"frame_playlist")
-        self.frame_playlist.setStyleSheet(u"")
         self.frame_playlist.setFrameShape(QFrame.Shape.StyledPanel)
         self.frame_playlist.setFrameShadow(QFrame.Shadow.Raised)
         self.playlist_layout = QHBoxLayout(self.frame_playlist)
@@ -42,7 +41,6 @@ class Ui_MainWindow(object):
 
         self.frame_timeline = QFrame(self.central_widget)
         self.frame_timeline.setObjectName(u"frame_timeline")
-        self.frame_timeline.setStyleSheet(u"")
         self.frame_timeline.setFrameShape(QFrame.Shape.StyledPanel)
         self.frame_timeline.setFrameShadow(QFrame.Shadow.Raised)
         self.timeline_layout = QVBoxLayout(self.frame_timeline)
@@ -53,7 +51,6 @@ class Ui_MainWindow(object):
 
         self.frame_mixer = QFrame(self.central_widget)
         self.frame_mixer.setObjectName(u"frame_mixer")
-        self.frame_mixer.setStyleSheet(u"")
         self.frame_mixer.setFrameShape(QFrame.Shape.StyledPanel)
         self.frame_mixer.setFrameShadow(QFrame.Shadow.Raised)
         self.mixer_layout = QHBoxLayout(self.frame_mixer)
@@ -92,7 +89,6 @@ class Ui_MainWindow(object):
         sizePolicy1.setVerticalStretch(0)
         sizePolicy1.setHeightForWidth(self.frame_mixer_master.sizePolicy().hasHeightForWidth())
         self.frame_mixer_master.setSizePolicy(sizePolicy1)
-        self.frame_mixer_master.setStyleSheet(u"")
         self.frame_mixer_master.setFrameShape(QFrame.Shape.StyledPanel)
         self.frame_mixer_master.setFrameShadow(QFrame.Shadow.Raised)
         self.mixer_master_layout = QHBoxLayout(self.frame_mixer_master)
@@ -106,7 +102,6 @@ class Ui_MainWindow(object):
 
         self.frame_controls = QFrame(self.central_widget)
         self.frame_controls.setObjectName(u"frame_controls")
-        self.frame_controls.setStyleSheet(u"")
         self.frame_controls.setFrameShape(QFrame.Shape.StyledPanel)
         self.frame_controls.setFrameShadow(QFrame.Shadow.Raised)
         self.controls_layout = QHBoxLayout(self.frame_controls)
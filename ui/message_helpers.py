@@ -8,6 +8,10 @@ con estilos consistentes de la aplicación.
 from PySide6.QtWidgets import QMessageBox, QWidget
 from PySide6.QtCore import Qt
 from ui.styles import StyleManager
+from ui.widgets.toast_notification import ToastNotification
+
+# (theme_version, stylesheet) del último estilo construido para QMessageBox
+_CACHED_STYLE: tuple[int, str] | None = None
 
 
 def show_info(parent: QWidget, title: str, message: str, detailed_text: str = None) -> None:
@@ -20,20 +24,10 @@ def show_info(parent: QWidget, title: str, message: str, detailed_text: str = No
         message: Texto principal
         detailed_text: Texto detallado opcional (expandible)
     """
-    msg_box = QMessageBox(parent)
-    msg_box.setIcon(QMessageBox.Information)
-    msg_box.setWindowTitle(title)
-    msg_box.setText(message)
-    
-    if detailed_text:
-        msg_box.setDetailedText(detailed_text)
-    
+    msg_box = _create_message_box(parent, QMessageBox.Information, title, message, detailed_text)
     msg_box.setStandardButtons(QMessageBox.Ok)
     msg_box.setDefaultButton(QMessageBox.Ok)
-    
-    # Aplicar estilo
-    _apply_message_style(msg_box)
-    msg_box.exec()
+    _exec_and_dispose(msg_box)
 
 
 def show_warning(parent: QWidget, title: str, message: str, detailed_text: str = None) -> None:
@@ -46,19 +40,10 @@ def show_warning(parent: QWidget, title: str, message: str, detailed_text: str =
         message: Texto principal
         detailed_text: Texto detallado opcional (expandible)
     """
-    msg_box = QMessageBox(parent)
-    msg_box.setIcon(QMessageBox.Warning)
-    msg_box.setWindowTitle(title)
-    msg_box.setText(message)
-    
-    if detailed_text:
-        msg_box.setDetailedText(detailed_text)
-    
+    msg_box = _create_message_box(parent, QMessageBox.Warning, title, message, detailed_text)
     msg_box.setStandardButtons(QMessageBox.Ok)
     msg_box.setDefaultButton(QMessageBox.Ok)
-    
-    _apply_message_style(msg_box)
-    msg_box.exec()
+    _exec_and_dispose(msg_box)
 
 
 def show_error(parent: QWidget, title: str, message: str, detailed_text: str = None) -> None:
@@ -71,19 +56,10 @@ def show_error(parent: QWidget, title: str, message: str, detailed_text: str = N
         message: Texto principal
         detailed_text: Texto detallado opcional (expandible)
     """
-    msg_box = QMessageBox(parent)
-    msg_box.setIcon(QMessageBox.Critical)
-    msg_box.setWindowTitle(title)
-    msg_box.setText(message)
-    
-    if detailed_text:
-        msg_box.setDetailedText(detailed_text)
-    
+    msg_box = _create_message_box(parent, QMessageBox.Critical, title, message, detailed_text)
     msg_box.setStandardButtons(QMessageBox.Ok)
     msg_box.setDefaultButton(QMessageBox.Ok)
-    
-    _apply_message_style(msg_box)
-    msg_box.exec()
+    _exec_and_dispose(msg_box)
 
 
 def show_question(
@@ -106,14 +82,7 @@ def show_question(
     Returns:
         True si el usuario selecciona Sí, False si selecciona No
     """
-    msg_box = QMessageBox(parent)
-    msg_box.setIcon(QMessageBox.Question)
-    msg_box.setWindowTitle(title)
-    msg_box.setText(message)
-    
-    if detailed_text:
-        msg_box.setDetailedText(detailed_text)
-    
+    msg_box = _create_message_box(parent, QMessageBox.Question, title, message, detailed_text)
     msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
     msg_box.setDefaultButton(QMessageBox.Yes if default_yes else QMessageBox.No)
     
@@ -121,13 +90,53 @@ def show_question(
     msg_box.button(QMessageBox.Yes).setText("Sí")
     msg_box.button(QMessageBox.No).setText("No")
     
-    _apply_message_style(msg_box)
-    result = msg_box.exec()
+    result = _exec_and_dispose(msg_box)
     
     return result == QMessageBox.Yes
 
 
-def show_success_toast(parent: QWidget, message: str, duration_ms: int = 3000) -> 'ToastNotification':
+def _create_message_box(
+    parent: QWidget,
+    icon: QMessageBox.Icon,
+    title: str,
+    message: str,
+    detailed_text: str = None
+) -> QMessageBox:
+    """
+    Crea un QMessageBox nuevo y estilizado.
+
+    Se crea uno por llamada: un mensaje modal puede abrirse mientras otro
+    sigue en exec() (p. ej. desde un slot del event loop anidado), y
+    reutilizar la misma caja sobrescribiría su texto.
+    
+    Args:
+        parent: Widget padre
+        icon: Icono del mensaje (determina el tipo)
+        title: Título del mensaje
+        message: Texto principal
+        detailed_text: Texto detallado opcional (expandible)
+    """
+    msg_box = QMessageBox(parent)
+    msg_box.setIcon(icon)
+    msg_box.setWindowTitle(title)
+    msg_box.setText(message)
+    
+    if detailed_text:
+        msg_box.setDetailedText(detailed_text)
+    
+    # Aplicar estilo
+    _apply_message_style(msg_box)
+    return msg_box
+
+
+def _exec_and_dispose(msg_box: QMessageBox) -> int:
+    """Ejecuta el diálogo modal y lo libera al cerrarse (no se acumulan hijos en el padre)."""
+    result = msg_box.exec()
+    msg_box.deleteLater()
+    return result
+
+
+def show_success_toast(parent: QWidget, message: str, duration_ms: int = 3000) -> ToastNotification:
     """
     Muestra una notificación toast de éxito (temporal, no-modal).
     
@@ -139,11 +148,10 @@ def show_success_toast(parent: QWidget, message: str, duration_ms: int = 3000) -
     Returns:
         ToastNotification instance
     """
-    from ui.widgets.toast_notification import ToastNotification
     return ToastNotification.show_success(parent, message, duration_ms)
 
 
-def show_info_toast(parent: QWidget, message: str, duration_ms: int = 3000) -> 'ToastNotification':
+def show_info_toast(parent: QWidget, message: str, duration_ms: int = 3000) -> ToastNotification:
     """
     Muestra una notificación toast informativa (temporal, no-modal).
     
@@ -155,11 +163,10 @@ def show_info_toast(parent: QWidget, message: str, duration_ms: int = 3000) -> '
     Returns:
         ToastNotification instance
     """
-    from ui.widgets.toast_notification import ToastNotification
     return ToastNotification.show_info(parent, message, duration_ms)
 
 
-def show_warning_toast(parent: QWidget, message: str, duration_ms: int = 4000) -> 'ToastNotification':
+def show_warning_toast(parent: QWidget, message: str, duration_ms: int = 4000) -> ToastNotification:
     """
     Muestra una notificación toast de advertencia (temporal, no-modal).
     
@@ -171,11 +178,10 @@ def show_warning_toast(parent: QWidget, message: str, duration_ms: int = 4000) -
     Returns:
         ToastNotification instance
     """
-    from ui.widgets.toast_notification import ToastNotification
     return ToastNotification.show_warning(parent, message, duration_ms)
 
 
-def show_error_toast(parent: QWidget, message: str, duration_ms: int = 5000) -> 'ToastNotification':
+def show_error_toast(parent: QWidget, message: str, duration_ms: int = 5000) -> ToastNotification:
     """
     Muestra una notificación toast de error (temporal, no-modal).
     
@@ -187,23 +193,34 @@ def show_error_toast(parent: QWidget, message: str, duration_ms: int = 5000) ->
     Returns:
         ToastNotification instance
     """
-    from ui.widgets.toast_notification import ToastNotification
     return ToastNotification.show_error(parent, message, duration_ms)
 
 
 def _apply_message_style(msg_box: QMessageBox) -> None:
     """
     Aplica estilo personalizado al QMessageBox.
+
+    La hoja de estilo se construye una sola vez por versión de tema
+    (ver ``StyleManager.theme_version``) y se reutiliza en llamadas siguientes.
     
     Args:
         msg_box: QMessageBox a estilizar
     """
+    global _CACHED_STYLE
+    theme_version = StyleManager.theme_version()
+    if _CACHED_STYLE is None or _CACHED_STYLE[0] != theme_version:
+        _CACHED_STYLE = (theme_version, _build_message_style())
+    msg_box.setStyleSheet(_CACHED_STYLE[1])
+
+
+def _build_message_style() -> str:
+    """Construye la hoja de estilo de QMessageBox a partir de los colores del tema."""
     # Aplicar colores del tema
     bg_color = StyleManager.get_color("background")
     text_color = StyleManager.get_color("text")
     accent_color = StyleManager.get_color("neon_blue")
     
-    msg_box.setStyleSheet(f"""
+    return f"""
         QMessageBox {{
             background-color: {bg_color.name()};
             color: {text_color.name()};
@@ -230,4 +247,4 @@ def _apply_message_style(msg_box: QMessageBox) -> None:
         QPushButton:default {{
             border: 2px solid {accent_color.lighter(150).name()};
         }}
-    """)
+    """
@@ -1,8 +1,108 @@
 import os
+import re
+from string import Template
 
-from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor, QFont, QFontDatabase, QPalette
 
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# $placeholders are PALETTE keys (use $$ for a literal $).
+_QSS_TEMPLATE = Template("""
+        QWidget {
+            color: $text_normal;
+            font-family: $font_main;
+            font-size: 14px;
+            background-color: transparent;
+        }
+        QFrame {
+            background-color: transparent;
+            border: none;
+        }
+
+        QWidget#central_widget{
+            background-color: $bg_base;
+        }
+
+        QFrame#frame_playlist, QFrame#frame_controls, QWidget#frame_mixer {
+
+        }
+
+        QFrame#frame_timeline {
+        }
+
+        QFrame#frame_mixer_tracks {
+            background-color: $bg_panel;
+            border-radius: 4px;
+        }
+
+        /* Botones fundidos con el fondo */
+        QPushButton {
+            background-color: $btn_normal;
+            color: $text_bright;
+            border-radius: 6px;
+            border: 1px solid $border_light;
+            padding: 6px 14px;
+        }
+
+        QPushButton:hover {
+            background-color: $btn_hover;
+            border: 1px solid $neon_cyan;
+        }
+
+        QPushButton:pressed {
+            background-color: $btn_pressed;
+        }
+
+        QPushButton:checked {
+            background-color: $btn_hover;
+            color: $neon_cyan;
+            border: 2px solid $neon_cyan;
+        }
+
+        QPushButton:disabled {
+            background-color: $btn_disabled;
+            color: $text_disabled;
+            border: 1px solid $border_disabled;
+        }
+
+        QPushButton[editing="true"] {
+            border: 2px solid $accent;
+            background-color: $accent_edit;
+            color: $accent;
+        }
+
+        QLabel#time_display, QLabel#label_time, QLabel#tempo_compass_label {
+            font-family: $font_mono;
+            font-size: 15pt;
+            padding: 4px 6px;
+            border-radius: 4px;
+            qproperty-alignment: 'AlignCenter';
+        }
+
+        QLabel#time_display, QLabel#label_time {
+            color: $neon_cyan;
+            background: $bg_panel;
+        }
+
+        QLabel#tempo_compass_label {
+            color: $accent_play;
+            background: $overlay_strong;
+        }
+
+        QWidget#drop_widget, QWidget#drop_widget QLabel {
+            background-color: $drop_bg;
+            border-radius: 10px;
+        }
+
+        QLabel#drop_text {
+            font-size: 18px;
+            color: $text_bright;
+        }
+        """)
+
 
 class StyleManager:
     """
@@ -90,6 +190,7 @@ class StyleManager:
         "text_normal": "#D0D6E8",
         "text_dim": "#7A8298",
         "text_disabled": "rgba(255, 255, 255, 0.25)",
+        "text_on_accent": "#000000",   # Texto sobre selección (accent)
 
         # UI elements
         "background": "rgb(14, 22, 48)",
@@ -97,6 +198,7 @@ class StyleManager:
         "surface_hover": "rgb(30, 50, 110)",
         "text": "#D0D6E8",
         "border": "rgba(255, 255, 255, 0.12)",
+        "drop_bg": "#2d2d2d",          # Zona de arrastre de AddDialog
 
         # ==========================
         # FUENTES
@@ -105,9 +207,19 @@ class StyleManager:
         "font_mono": "'JetBrains Mono', 'Cascadia Code', 'Consolas', monospace"
     }
 
+    # Bumped by setup_theme so callers can invalidate stylesheets derived from PALETTE
+    _theme_version = 0
+
+    # Generated QSS; PALETTE is fixed for the process, so it is built once
+    _cached_qss = None
+
     @classmethod
-    def get_color(cls, color_name):
-        color_str = cls.PALETTE.get(color_name, "#FFFFFF")
+    def theme_version(cls) -> int:
+        return cls._theme_version
+
+    @staticmethod
+    def _parse_color(color_str):
+        color_str = color_str.rstrip("; ")
         if "rgba" in color_str:
             parts = color_str.replace("rgba(", "").replace(")", "").split(",")
             return QColor(
@@ -121,134 +233,147 @@ class StyleManager:
             return QColor(int(parts[0]), int(parts[1]), int(parts[2]))
         return QColor(color_str)
 
+    @classmethod
+    def _build_color_cache(cls):
+        """Parse every PALETTE color once so get_color is a dict lookup."""
+        cls._QCOLOR_CACHE = {
+            name: cls._parse_color(value)
+            for name, value in cls.PALETTE.items()
+            if not name.startswith("font_")
+        }
+
+    @classmethod
+    def get_color(cls, color_name):
+        color = cls._QCOLOR_CACHE.get(color_name)
+        if color is None:
+            return QColor("#FFFFFF")
+        # Copy: callers adjust alpha etc. on the returned color
+        return QColor(color)
+
+    # (mono, size, bold) -> QFont; paint paths ask for the same few fonts every frame
+    _FONT_CACHE = {}
+
     @classmethod
     def get_font(cls, mono=False, size=10, bold=False):
-        family = "Roboto" if not mono else "JetBrains Mono"
-        weight = QFont.Bold if bold else QFont.Normal
-        font = QFont(family, size)
-        font.setWeight(weight)
-        return font
+        key = (mono, size, bold)
+        font = cls._FONT_CACHE.get(key)
+        if font is None:
+            family = cls._RESOLVED_FAMILIES["mono" if mono else "main"]
+            font = QFont(family, size)
+            font.setWeight(QFont.Bold if bold else QFont.Normal)
+            cls._FONT_CACHE[key] = font
+        # Copy (implicitly shared, cheap): callers adjust size/bold on the result
+        return QFont(font)
+
+    # TTFs bundled in <root>/assets/fonts -> get_font family slot
+    FONT_FILES = {
+        "Roboto-Regular.ttf": "main",
+        "Roboto-Bold.ttf": "main",
+        "JetBrainsMono-Regular.ttf": "mono",
+    }
+
+    # Family names as registered by load_fonts; defaults until it runs
+    _RESOLVED_FAMILIES = {"main": "Roboto", "mono": "JetBrains Mono"}
 
     @classmethod
     def load_fonts(cls):
-        font_path = os.path.join(os.path.dirname(__file__), "assets", "fonts")
-        fonts = [
-            "Roboto-Regular.ttf",
-            "Roboto-Bold.ttf",
-            "JetBrainsMono-Regular.ttf"
-        ]
-        for font in fonts:
-            full_path = os.path.join(font_path, font)
-            if os.path.exists(full_path):
-                QFontDatabase.addApplicationFont(full_path)
+        font_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "assets", "fonts",
+        )
+        # One directory read instead of a stat per font
+        try:
+            with os.scandir(font_path) as entries:
+                for entry in entries:
+                    slot = cls.FONT_FILES.get(entry.name)
+                    if slot is None:
+                        continue
+                    font_id = QFontDatabase.addApplicationFont(entry.path)
+                    families = QFontDatabase.applicationFontFamilies(font_id)
+                    if families:
+                        cls._RESOLVED_FAMILIES[slot] = families[0]
+        except FileNotFoundError:
+            pass
+
+    # QPalette role -> PALETTE key; resolved through the pre-parsed color cache
+    _PALETTE_ROLES = (
+        (QPalette.Window, "bg_base"),
+        (QPalette.WindowText, "text_normal"),
+        (QPalette.Base, "bg_workspace"),
+        (QPalette.Text, "text_normal"),
+        (QPalette.Button, "bg_panel"),
+        (QPalette.ButtonText, "text_bright"),
+        (QPalette.Highlight, "accent"),
+        (QPalette.HighlightedText, "text_on_accent"),
+    )
+    # setColor(role, c) fills every color group; Disabled then gets these
+    _DISABLED_ROLES = (
+        (QPalette.WindowText, "text_disabled"),
+        (QPalette.Text, "text_disabled"),
+        (QPalette.ButtonText, "text_disabled"),
+        (QPalette.Button, "btn_disabled"),
+    )
+
+    # Dynamic property marking an app already themed (setup_theme is idempotent)
+    _APPLIED_PROPERTY = "styleManagerApplied"
 
     @classmethod
     def setup_theme(cls, app):
-        cls.load_fonts()
-
-        palette = QPalette()
-        base_color = cls.get_color("bg_base")
-        text_color = cls.get_color("text_normal")
-
-        palette.setColor(QPalette.Window, base_color)
-        palette.setColor(QPalette.WindowText, text_color)
-        palette.setColor(QPalette.Base, cls.get_color("bg_workspace"))
-        palette.setColor(QPalette.Text, text_color)
-        palette.setColor(QPalette.Button, cls.get_color("bg_panel"))
-        palette.setColor(QPalette.ButtonText, Qt.white)
-        palette.setColor(QPalette.Highlight, cls.get_color("accent"))
-        palette.setColor(QPalette.HighlightedText, Qt.black)
+        """Register the bundled fonts, then apply palette and stylesheet.
 
-        app.setPalette(palette)
+        Call it right after creating the QApplication, before building
+        any widget: applying it later re-polishes every existing widget.
+        Fonts are registered first so the stylesheet resolves the bundled
+        families in a single polish. Later calls on the same app are no-ops.
+        """
+        if app.property(cls._APPLIED_PROPERTY):
+            return
+        app.setProperty(cls._APPLIED_PROPERTY, True)
+        if app.topLevelWidgets():
+            logger.warning("setup_theme called after widgets exist; full re-polish")
+        cls.load_fonts()
+        current = app.palette()
+        # Start from the active palette so untouched roles keep their brushes
+        palette = QPalette(current)
+        # Skip roles the style already resolves to the same color. Only the
+        # first setColor detaches the shared data; later ones write in place.
+        for role, name in cls._PALETTE_ROLES:
+            color = cls._QCOLOR_CACHE[name]
+            if current.color(role) != color:
+                palette.setColor(role, color)
+        for role, name in cls._DISABLED_ROLES:
+            color = cls._QCOLOR_CACHE[name]
+            if palette.color(QPalette.Disabled, role) != color:
+                palette.setColor(QPalette.Disabled, role, color)
+
+        if palette != current:
+            app.setPalette(palette)
         app.setStyleSheet(cls.get_stylesheet())
+        cls._theme_version += 1
 
     @classmethod
     def get_stylesheet(cls):
-        return f"""
-        QWidget {{
-            color: {cls.PALETTE['text_normal']};
-            font-family: {cls.PALETTE['font_main']};
-            font-size: 14px;
-            background-color: transparent;
-        }}
-        QFrame {{
-            background-color: transparent;
-            border: none;
-        }}
-
-        QWidget#central_widget{{
-            background-color: {cls.PALETTE['bg_base']};
-        }}
-
-        QFrame#frame_playlist, QFrame#frame_controls, QWidget#frame_mixer {{
+        if cls._cached_qss is None:
+            cls._cached_qss = cls._build_stylesheet()
+        return cls._cached_qss
 
-        }}
-
-        QFrame#frame_timeline {{
-        }}
+    @classmethod
+    def _build_stylesheet(cls):
+        return cls._minify(_QSS_TEMPLATE.substitute(cls.PALETTE))
 
-        QFrame#frame_mixer_tracks {{
-            background-color: {cls.PALETTE['bg_panel']};
-            border-radius: 4px;
-        }}
+    _QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+    _QSS_SPACE_RE = re.compile(r"\s+")
+    _QSS_PUNCT_RE = re.compile(r" ?([{};:,]) ?")
 
-        /* Botones fundidos con el fondo */
-        QPushButton {{
-            background-color: {cls.PALETTE['btn_normal']};
-            color: {cls.PALETTE['text_bright']};
-            border-radius: 6px;
-            border: 1px solid {cls.PALETTE['border_light']};
-            padding: 6px 14px;
-        }}
-
-        QPushButton:hover {{
-            background-color: {cls.PALETTE['btn_hover']};
-            border: 1px solid {cls.PALETTE['neon_cyan']};
-        }}
-
-        QPushButton:pressed {{
-            background-color: {cls.PALETTE['btn_pressed']};
-        }}
-
-        QPushButton:checked {{
-            background-color: {cls.PALETTE['btn_hover']};
-            color: {cls.PALETTE['neon_cyan']};
-            border: 2px solid {cls.PALETTE['neon_cyan']};
-        }}
-
-        QPushButton:disabled {{
-            background-color: {cls.PALETTE['btn_disabled']};
-            color: {cls.PALETTE['text_disabled']};
-            border: 1px solid {cls.PALETTE['border_disabled']};
-        }}
-
-        QPushButton[editing="true"] {{
-            border: 2px solid {cls.PALETTE['accent']};
-            background-color: {cls.PALETTE['accent_edit']};
-            color: {cls.PALETTE['accent']};
-        }}
-
-        QLabel#time_display, QLabel#label_time {{
-            font-family: {cls.PALETTE['font_mono']};
-            font-size: 15pt;
-            color: {cls.PALETTE['neon_cyan']};
-            background: {cls.PALETTE['bg_panel']};
-            padding: 4px 6px;
-            border-radius: 4px;
-            qproperty-alignment: 'AlignCenter';
-        }}
+    @classmethod
+    def _minify(cls, qss):
+        """Strip comments and whitespace so Qt's CSS parser scans fewer bytes."""
+        qss = cls._QSS_COMMENT_RE.sub("", qss)
+        qss = cls._QSS_SPACE_RE.sub(" ", qss)
+        return cls._QSS_PUNCT_RE.sub(r"\1", qss).strip()
 
-        QLabel#tempo_compass_label {{
-            font-family: {cls.PALETTE['font_mono']};
-            font-size: 15pt;
-            color: {cls.PALETTE['accent_play']};
-            background: {cls.PALETTE['overlay_strong']};
-            padding: 4px 6px;
-            border-radius: 4px;
-            qproperty-alignment: 'AlignCenter';
-        }}
-        """
 
+StyleManager._build_color_cache()
 
 
 """
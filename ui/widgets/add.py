@@ -1,8 +1,8 @@
 import os
 
-from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
 from PySide6.QtWidgets import (QDialog, QHBoxLayout, QPushButton,
-                               QStackedWidget, QVBoxLayout)
+                               QStackedWidget, QVBoxLayout, QWidget)
 
 from .drop_widget import DropWidget
 from .search_widget import SearchWidget
@@ -13,8 +13,13 @@ class AddDialog(QDialog):
 
     Uses XCB platform (via libxcb-cursor0) for reliable rendering on Linux.
     Static dialog centered on parent window (non-movable).
+    The DropWidget page is built the first time it is shown; its
+    ``file_imported`` is re-emitted by the dialog, unless the dialog was
+    closed while the copy was still running.
     """
 
+    file_imported = Signal(str)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Agregar Multi")
@@ -38,10 +43,15 @@ class AddDialog(QDialog):
         self.search_widget.multi_selected.connect(self.close_modal)
         self.stackedWidget.addWidget(self.search_widget)
 
-        # add DropWidget
-        self.drop_widget = DropWidget()
-        self.drop_widget.file_imported.connect(self.close_modal)
-        self.stackedWidget.addWidget(self.drop_widget)
+        # DropWidget: placeholder until first visit (most sessions only search)
+        self.drop_widget = None
+        self._drop_placeholder = QWidget()
+        self.stackedWidget.addWidget(self._drop_placeholder)
+
+        self._finished = False  # set by done(); late copy results are dropped
+
+        self._page_count = self.stackedWidget.count()
+        self._current_page = 0
 
         buttonPrevious = QPushButton('Buscar')
         buttonPrevious.clicked.connect(self.previousWidget)
@@ -58,16 +68,43 @@ class AddDialog(QDialog):
 
         self.setLayout(mainLayout)
 
+    @Slot()
     def nextWidget(self):
-        self.stackedWidget.setCurrentIndex((self.stackedWidget.currentIndex() + 1) % 3)
-
-    def previousWidget(self):
-        self.stackedWidget.setCurrentIndex((self.stackedWidget.currentIndex() - 1) % 3)
+        self._current_page = (self._current_page + 1) % self._page_count
+        self._show_page(self._current_page)
 
     @Slot()
+    def previousWidget(self):
+        self._current_page = (self._current_page - 1) % self._page_count
+        self._show_page(self._current_page)
+
+    def _show_page(self, index):
+        if index == 1 and self.drop_widget is None:
+            self.drop_widget = DropWidget()
+            self.drop_widget.file_imported.connect(self._on_file_imported)
+            self.stackedWidget.insertWidget(1, self.drop_widget)
+            self.stackedWidget.removeWidget(self._drop_placeholder)
+            self._drop_placeholder.deleteLater()
+            self._drop_placeholder = None
+        self.stackedWidget.setCurrentIndex(index)
+
+    @Slot(str)
     def close_modal(self, path):
         self.accept()
 
+    @Slot(str)
+    def _on_file_imported(self, path):
+        # La copia corre en segundo plano: si el usuario ya cerró el
+        # diálogo, no arrancar la extracción
+        if self._finished:
+            return
+        self.close_modal(path)
+        self.file_imported.emit(path)
+
+    def done(self, result):
+        self._finished = True
+        super().done(result)
+
 
 
 
@@ -1,15 +1,61 @@
 import shutil
 from pathlib import Path
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt, QPoint, Signal, QTimer
+from PySide6.QtCore import Qt, QObject, QPoint, QRunnable, QThreadPool, Signal, Slot
 from PySide6.QtGui import QPixmap, QDragEnterEvent, QDropEvent
 from core import constants
+from utils.helpers import get_icon
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _CopySignals(QObject):
+    finished = Signal(int, str)  # archivos copiados, ruta del último ("" si ninguno)
+
+
+class _CopyWorker(QRunnable):
+    """Copies dropped videos on a pool thread so the dialog stays responsive."""
+
+    def __init__(self, jobs):
+        super().__init__()
+        self.jobs = jobs  # [(origen, destino), ...]
+        self.signals = _CopySignals()
+
+    def run(self):
+        copied = 0
+        last_path = ""
+        for src, dst in self.jobs:
+            try:
+                # copyfile: fresh target, no need for copy()'s permission pass
+                shutil.copyfile(src, dst)
+            except OSError as e:
+                logger.error(f"No se pudo copiar {src} -> {dst}: {e}")
+                continue
+            copied += 1
+            last_path = str(dst)
+        # Receiver lives in the GUI thread -> queued delivery
+        self.signals.finished.emit(copied, last_path)
 
 
 class DropWidget(QWidget):
 
     file_imported = Signal(str)
 
+    _ICON_PIXMAP = None  # 128px icon shared by every instance (AddDialog is recreated per open)
+
+    @classmethod
+    def _icon_pixmap(cls):
+        if cls._ICON_PIXMAP is None:
+            # Rasterizado por el QIcon compartido directamente a 128px, sin
+            # decodificar a tamaño nativo y reescalar
+            pix = get_icon("assets/img/media-video-plus.svg").pixmap(128, 128)
+            if pix.isNull():                  # Si no encuentra icono, dibuja uno por defecto
+                pix = QPixmap(128, 128)
+                pix.fill(Qt.lightGray)
+            cls._ICON_PIXMAP = pix
+        return cls._ICON_PIXMAP
+
     def __init__(self):
         super().__init__()
 
@@ -24,29 +70,21 @@ class DropWidget(QWidget):
 
         # --- ÍCONO GRANDE ---
         self.icon_label = QLabel()
-        pix = QPixmap( "assets/img/media-video-plus.svg" )  # <--- reemplaza por tu ícono
-        if pix.isNull():                  # Si no encuentra icono, dibuja uno por defecto
-            pix = QPixmap(128, 128)
-            pix.fill(Qt.lightGray)
-
-        self.icon_label.setPixmap(pix.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.icon_label.setPixmap(self._icon_pixmap())
         self.icon_label.setAlignment(Qt.AlignCenter)
 
         # --- TEXTO ---
         self.text_label = QLabel("Arrastra aquí\nMP4", self)
         self.text_label.setAlignment(Qt.AlignCenter)
-        self.text_label.setStyleSheet("font-size: 18px; color: white;")
-
-        # Fondo de la ventana
-        self.setStyleSheet("""
-            background-color: #2d2d2d;
-            border-radius: 10px;
-        """)
+        # Estilo (fondo y texto) en la hoja global de StyleManager
+        self.text_label.setObjectName("drop_text")
+        self.setObjectName("drop_widget")
 
         layout.addWidget(self.icon_label)
         layout.addWidget(self.text_label)
 
         self.dragPos = QPoint()
+        self._copy_workers = set()  # in-flight copies; keeps their signals alive
 
     # ----------------------------
     # Ventana Draggable
@@ -73,8 +111,7 @@ class DropWidget(QWidget):
         multis_folder.mkdir(exist_ok=True)
 
         valid_ext = {".mp4"}
-        copied = 0
-        last_path = None
+        jobs = []
 
         for url in event.mimeData().urls():
             file_path = Path(url.toLocalFile())      
@@ -84,24 +121,35 @@ class DropWidget(QWidget):
                 folder_name = file_path.stem  #tomamos el nombre del archivo y se lo ponemos al folder
                 target_folder = multis_folder / folder_name
 
-                target_folder.mkdir(exist_ok=True)
                 NEW_FILE_NAME = constants.VIDEO_FILE + file_path.suffix.lower() # ej.video.mp4
                 final_path = target_folder / NEW_FILE_NAME
-                shutil.copy(file_path, final_path)
-                copied += 1
-                last_path = final_path
+                jobs.append((file_path, final_path))
+
+        # Un mkdir por carpeta distinta del lote
+        for target_folder in {dst.parent for _, dst in jobs}:
+            target_folder.mkdir(exist_ok=True)
 
+        event.acceptProposedAction()
+
+        if not jobs:
+            self.text_label.setText("Formato no permitido")
+            return
+
+        # La copia (MP4 grandes) corre en el pool; el resultado vuelve por señal
+        self.text_label.setText("Copiando...")
+        worker = _CopyWorker(jobs)
+        worker.signals.finished.connect(self._on_copy_finished)
+        self._copy_workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(int, str)
+    def _on_copy_finished(self, copied, last_path):
+        self._copy_workers = {w for w in self._copy_workers if w.signals is not self.sender()}
         if copied > 0:
             self.text_label.setText(f"¡{copied} archivo(s) copiado(s)!")
         else:
-            self.text_label.setText("Formato no permitido")
-
-        event.acceptProposedAction()
+            self.text_label.setText("No se pudo copiar el archivo")
 
         if last_path:
-            QTimer.singleShot(  #usamos singleShot para evitar fallo critico al cerrar modal 
-                0,
-                lambda p=str(last_path): self.file_imported.emit(p)
-            )
-
-
+            # Ya fuera de dropEvent: cerrar el modal desde aquí es seguro
+            self.file_imported.emit(last_path)
@@ -17,11 +17,19 @@ from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
 from ui.styles import StyleManager
 
+# (usage % upper bound, style key, color, status glyph), scanned in order
+_USAGE_LEVELS = (
+    (50, "ok", "#00FF7F", "✓"),             # Green (healthy)
+    (80, "warn", "#FFA500", "⚠"),           # Orange (acceptable)
+    (float("inf"), "crit", "#FF4444", "✗"),  # Red (critical)
+)
+
 
 class LatencyMonitor(QWidget):
     """
     Lightweight widget to display audio callback latency statistics.
-    Updates every 500ms to avoid UI overhead.
+    Polls every 500ms while visible, and only rebuilds the text when the
+    engine has processed new callbacks since the previous tick.
 
     Color coding:
     - Green: Usage < 50% (healthy)
@@ -37,12 +45,13 @@ class LatencyMonitor(QWidget):
         """
         super().__init__(parent)
         self.engine = engine
+        self._last_callback_count = None  # None forces the first refresh
         self.init_ui()
 
-        # Update timer (500ms refresh rate)
-        self.update_timer = QTimer()
+        # Update timer (500ms refresh rate); runs only while the widget is shown
+        self.update_timer = QTimer(self)
+        self.update_timer.setInterval(500)  # 2 Hz update rate
         self.update_timer.timeout.connect(self.update_stats)
-        self.update_timer.start(500)  # 2 Hz update rate
 
     def init_ui(self):
         """Initialize UI layout and labels."""
@@ -69,6 +78,18 @@ class LatencyMonitor(QWidget):
         self.stats_label.setStyleSheet("padding: 6px;")
         layout.addWidget(self.stats_label)
 
+        # Stats label stylesheets, built once; applied only when the bucket changes
+        self._stats_qss = {
+            key: f"color: {color}; padding: 6px;"
+            for key, color in (
+                *((key, color) for _, key, color, _ in _USAGE_LEVELS),
+                ("dim", StyleManager.get_color('text_dim').name()),
+                ("error", StyleManager.get_color('error').name()),
+            )
+        }
+        self._stats_qss_key = None
+        self._stats_text = self.stats_label.text()
+
         # Set background
         self.setStyleSheet(f"""
             QWidget {{
@@ -80,28 +101,30 @@ class LatencyMonitor(QWidget):
 
     def update_stats(self):
         """Update displayed statistics from engine."""
-        if not self.engine:
+        # A queued timeout can still arrive right after hideEvent
+        if not self.engine or not self.isVisible():
             return
 
         try:
+            # Stats only change when the audio callback runs; skip idle ticks
+            callback_count = self.engine.get_callback_count()
+            if callback_count == self._last_callback_count:
+                return
+            self._last_callback_count = callback_count
+
             stats = self.engine.get_latency_stats()
+            total_callbacks = stats['total_callbacks']
 
-            if stats['total_callbacks'] == 0:
-                self.stats_label.setText("⏸️  No playback activity")
-                self.stats_label.setStyleSheet(f"color: {StyleManager.get_color('text_dim').name()}; padding: 6px;")
+            if total_callbacks == 0:
+                self._set_stats_text("⏸️  No playback activity")
+                self._set_stats_style("dim")
                 return
 
             # Determine color based on usage percentage
             usage_pct = stats['usage_pct']
-            if usage_pct < 50:
-                color = "#00FF7F"  # Green (healthy)
-                status = "✓"
-            elif usage_pct < 80:
-                color = "#FFA500"  # Orange (acceptable)
-                status = "⚠"
-            else:
-                color = "#FF4444"  # Red (critical)
-                status = "✗"
+            for limit, style, _, status in _USAGE_LEVELS:
+                if usage_pct < limit:
+                    break
 
             # Format stats text (vertical layout for narrow widget)
             text = (
@@ -110,15 +133,40 @@ class LatencyMonitor(QWidget):
                 f"  Budget: {stats['budget_ms']:>4.1f} ms\n"
                 f"  Usage:  {usage_pct:>5.1f} %\n"
                 f"  Xruns:  {stats['xruns']:>6}\n"
-                f"  Calls:  {stats['total_callbacks']:>6}"
+                f"  Calls:  {total_callbacks:>6}"
             )
 
-            self.stats_label.setText(text)
-            self.stats_label.setStyleSheet(f"color: {color}; padding: 6px;")
+            self._set_stats_text(text)
+            self._set_stats_style(style)
 
         except Exception as e:
-            self.stats_label.setText(f"❌ Error reading stats: {e}")
-            self.stats_label.setStyleSheet(f"color: {StyleManager.get_color('error')}; padding: 6px;")
+            self._set_stats_text(f"❌ Error reading stats: {e}")
+            self._set_stats_style("error")
+
+    def _set_stats_text(self, text):
+        """Set the stats text, skipping the relayout if it is unchanged."""
+        if text == self._stats_text:
+            return
+        self._stats_text = text
+        self.stats_label.setText(text)
+
+    def _set_stats_style(self, key):
+        """Apply a cached stats stylesheet, skipping the QSS re-parse if unchanged."""
+        if key == self._stats_qss_key:
+            return
+        self._stats_qss_key = key
+        self.stats_label.setStyleSheet(self._stats_qss[key])
+
+    def showEvent(self, event):
+        """Start polling when the monitor becomes visible."""
+        super().showEvent(event)
+        self.update_stats()
+        self.update_timer.start()
+
+    def hideEvent(self, event):
+        """Stop polling while hidden (monitor is off by default)."""
+        self.update_timer.stop()
+        super().hideEvent(event)
 
     def closeEvent(self, event):
         """Stop timer when widget is closed."""
@@ -5,15 +5,113 @@ Combines functionality of MetadataEditorDialog and LyricsSelectorDialog.
 Shows initial results and allows user to refine search by editing metadata.
 """
 
+from collections import OrderedDict
+from string import Template
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QPushButton, QListWidget, QListWidgetItem, QFrame
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal, Slot
 from PySide6.QtGui import QFont
 
 from ui.styles import StyleManager
 
+# Dialog QSS; $placeholders are StyleManager.PALETTE keys.
+_QSS_TEMPLATE = Template("""
+        QDialog {
+            background-color: $background;
+        }
+        QLabel {
+            color: $text;
+            font-size: 12px;
+        }
+        QLabel#dim_label {
+            color: $text_dim;
+            font-size: 11px;
+        }
+        QLineEdit {
+            background-color: $surface;
+            color: $text;
+            border: 1px solid $border;
+            border-radius: 4px;
+            padding: 8px;
+            font-size: 13px;
+        }
+        QLineEdit:focus {
+            border: 1px solid $accent;
+        }
+        QPushButton {
+            background-color: $surface;
+            color: $text;
+            border: 1px solid $border;
+            border-radius: 4px;
+            padding: 8px 16px;
+            font-size: 13px;
+        }
+        QPushButton:hover {
+            background-color: $surface_hover;
+            border: 1px solid $accent;
+        }
+        QPushButton#primary {
+            background-color: $accent;
+            color: $background;
+            border: none;
+        }
+        QPushButton#primary:hover {
+            background-color: $accent_hover;
+        }
+        QPushButton:disabled {
+            background-color: $surface;
+            color: $text_dim;
+            border: 1px solid $border;
+        }
+        QListWidget {
+            background-color: $surface;
+            color: $text;
+            border: 1px solid $border;
+            border-radius: 4px;
+            font-size: 13px;
+        }
+        QListWidget::item {
+            padding: 8px;
+            border-bottom: 1px solid $border;
+        }
+        QListWidget::item:selected {
+            background-color: $accent;
+            color: $background;
+        }
+        QListWidget::item:hover {
+            background-color: $surface_hover;
+        }
+    """)
+
+
+class _SearchSignals(QObject):
+    finished = Signal(int, list)  # search id, results
+    failed = Signal(int, str)     # search id, error message
+
+
+class _SearchWorker(QRunnable):
+    """Runs the blocking LRCLIB search on a pool thread so the dialog keeps repainting."""
+
+    def __init__(self, search_id: int, lyrics_loader, track_name: str, artist_name: str):
+        super().__init__()
+        self.search_id = search_id
+        self.lyrics_loader = lyrics_loader
+        self.track_name = track_name
+        self.artist_name = artist_name
+        self.signals = _SearchSignals()
+
+    def run(self):
+        try:
+            results = self.lyrics_loader.search_all(self.track_name, self.artist_name)
+        except Exception as e:
+            self.signals.failed.emit(self.search_id, str(e))
+            return
+        # Receiver lives in the GUI thread -> queued delivery
+        self.signals.finished.emit(self.search_id, results)
+
 
 class LyricsSearchDialog(QDialog):
     """Unified dialog for searching and selecting lyrics.
@@ -28,6 +126,20 @@ class LyricsSearchDialog(QDialog):
     # Signals
     lyrics_selected = Signal(dict)  # Emits selected result
     search_skipped = Signal()       # User skipped lyrics search
+
+    # Recent (track, artist) searches remembered per dialog
+    SEARCH_CACHE_SIZE = 32
+
+    # (theme_version, stylesheet): built once per theme, shared by every dialog
+    _STYLESHEET_CACHE: tuple[int, str] | None = None
+
+    @classmethod
+    def _get_stylesheet(cls) -> str:
+        """Return the dialog stylesheet, substituting the palette only on theme changes."""
+        theme_version = StyleManager.theme_version()
+        if cls._STYLESHEET_CACHE is None or cls._STYLESHEET_CACHE[0] != theme_version:
+            cls._STYLESHEET_CACHE = (theme_version, _QSS_TEMPLATE.substitute(StyleManager.PALETTE))
+        return cls._STYLESHEET_CACHE[1]
     
     def __init__(self, metadata: dict, initial_results: list, lyrics_loader, parent=None, skip_initial_search: bool = False):
         """
@@ -45,6 +157,11 @@ class LyricsSearchDialog(QDialog):
         # If skip_initial_search is True, start with empty results
         self.results = [] if skip_initial_search else initial_results
         self.selected_result = None
+        # Id of the search whose results are still wanted; bumped on close
+        self._search_id = 0
+        self._search_worker = None  # keeps the worker's signals alive until delivery
+        # (track, artist) casefolded -> results; re-searching skips the HTTP round-trip
+        self._result_cache: OrderedDict[tuple[str, str], list] = OrderedDict()
         
         self.setWindowTitle("Buscar Letras")
         self.setModal(True)
@@ -55,73 +172,7 @@ class LyricsSearchDialog(QDialog):
         self._populate_results()
         
         # Apply styling
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {StyleManager.get_color('background')};
-            }}
-            QLabel {{
-                color: {StyleManager.get_color('text')};
-                font-size: 12px;
-            }}
-            QLabel#dim_label {{
-                color: {StyleManager.get_color('text_dim')};
-                font-size: 11px;
-            }}
-            QLineEdit {{
-                background-color: {StyleManager.get_color('surface')};
-                color: {StyleManager.get_color('text')};
-                border: 1px solid {StyleManager.get_color('border')};
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 13px;
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {StyleManager.get_color('accent')};
-            }}
-            QPushButton {{
-                background-color: {StyleManager.get_color('surface')};
-                color: {StyleManager.get_color('text')};
-                border: 1px solid {StyleManager.get_color('border')};
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: {StyleManager.get_color('surface_hover')};
-                border: 1px solid {StyleManager.get_color('accent')};
-            }}
-            QPushButton#primary {{
-                background-color: {StyleManager.get_color('accent')};
-                color: {StyleManager.get_color('background')};
-                border: none;
-            }}
-            QPushButton#primary:hover {{
-                background-color: {StyleManager.get_color('accent_hover')};
-            }}
-            QPushButton:disabled {{
-                background-color: {StyleManager.get_color('surface')};
-                color: {StyleManager.get_color('text_dim')};
-                border: 1px solid {StyleManager.get_color('border')};
-            }}
-            QListWidget {{
-                background-color: {StyleManager.get_color('surface')};
-                color: {StyleManager.get_color('text')};
-                border: 1px solid {StyleManager.get_color('border')};
-                border-radius: 4px;
-                font-size: 13px;
-            }}
-            QListWidget::item {{
-                padding: 8px;
-                border-bottom: 1px solid {StyleManager.get_color('border')};
-            }}
-            QListWidget::item:selected {{
-                background-color: {StyleManager.get_color('accent')};
-                color: {StyleManager.get_color('background')};
-            }}
-            QListWidget::item:hover {{
-                background-color: {StyleManager.get_color('surface_hover')};
-            }}
-        """)
+        self.setStyleSheet(self._get_stylesheet())
     
     def _setup_ui(self):
         """Setup dialog UI"""
@@ -220,9 +271,12 @@ class LyricsSearchDialog(QDialog):
             return
         
         duration = self.metadata.get('duration_seconds', 0)
-        exact_match_found = False
+        success_color = StyleManager.get_color('success')
+        first_match_row = None
         
-        for result in self.results:
+        # One repaint for the whole batch instead of one per added row
+        self.results_list.setUpdatesEnabled(False)
+        for row, result in enumerate(self.results):
             track_name = result.get('trackName', 'Desconocido')
             artist_name = result.get('artistName', 'Desconocido')
             result_duration = result.get('duration', 0)
@@ -239,18 +293,21 @@ class LyricsSearchDialog(QDialog):
             item = QListWidgetItem(item_text)
             item.setData(Qt.UserRole, result)  # Store result data
             
-            # Add item to list first
-            self.results_list.addItem(item)
-            
-            # Highlight exact matches (≤1s) in green
+            # Highlight exact matches (≤1s) in green (before insertion: no dataChanged)
             if duration_diff <= 1.0:
-                exact_match_found = True
-                item.setForeground(StyleManager.get_color('success'))
-                # Auto-select first exact match
-                if not self.selected_result:
-                    self.results_list.setCurrentItem(item)
-                    self.selected_result = result
-                    self.download_btn.setEnabled(True)
+                item.setForeground(success_color)
+                if first_match_row is None:
+                    first_match_row = row
+            
+            self.results_list.addItem(item)
+        self.results_list.setUpdatesEnabled(True)
+        
+        exact_match_found = first_match_row is not None
+        # Auto-select first exact match, once, after the batch
+        if exact_match_found and not self.selected_result:
+            self.results_list.setCurrentRow(first_match_row)
+            self.selected_result = self.results[first_match_row]
+            self.download_btn.setEnabled(True)
         
         # Update info label
         if exact_match_found:
@@ -267,21 +324,56 @@ class LyricsSearchDialog(QDialog):
             self.info_label.setText("⚠ Por favor ingresa el nombre de la canción y el artista")
             return
         
+        if self._search_worker is not None:
+            return  # A search is already running (e.g. Enter pressed twice)
+        
+        key = (track_name.casefold(), artist_name.casefold())
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            self.results = cached
+            self._populate_results()
+            return
+        
         # Show loading state
         self.search_btn.setEnabled(False)
         self.search_btn.setText("Buscando...")
         self.info_label.setText("Buscando en LRCLIB...")
         
-        # Perform search
-        try:
-            results = self.lyrics_loader.search_all(track_name, artist_name)
-            self.results = results
-            self._populate_results()
-        except Exception as e:
-            self.info_label.setText(f"⚠ Error en la búsqueda: {str(e)}")
-        finally:
-            self.search_btn.setEnabled(True)
-            self.search_btn.setText("🔍 Buscar Letras")
+        # Perform search off the GUI thread (blocking HTTP request)
+        self._search_id += 1
+        self._search_worker = _SearchWorker(self._search_id, self.lyrics_loader, track_name, artist_name)
+        self._search_worker.signals.finished.connect(self._on_search_finished)
+        self._search_worker.signals.failed.connect(self._on_search_failed)
+        QThreadPool.globalInstance().start(self._search_worker)
+    
+    @Slot(int, list)
+    def _on_search_finished(self, search_id: int, results: list):
+        """Search worker returned results"""
+        if search_id != self._search_id:
+            return  # Dialog closed or a newer search started
+        worker, self._search_worker = self._search_worker, None
+        # LyricsLoader reports network errors as [] too: only cache real hits
+        if results:
+            self._result_cache[(worker.track_name.casefold(), worker.artist_name.casefold())] = results
+            if len(self._result_cache) > self.SEARCH_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        self.results = results
+        self._populate_results()
+        self._reset_search_button()
+    
+    @Slot(int, str)
+    def _on_search_failed(self, search_id: int, message: str):
+        """Search worker raised"""
+        if search_id != self._search_id:
+            return
+        self._search_worker = None
+        self.info_label.setText(f"⚠ Error en la búsqueda: {message}")
+        self._reset_search_button()
+    
+    def _reset_search_button(self):
+        self.search_btn.setEnabled(True)
+        self.search_btn.setText("🔍 Buscar Letras")
     
     def _on_result_clicked(self, item: QListWidgetItem):
         """User clicked a result item"""
@@ -303,3 +395,8 @@ class LyricsSearchDialog(QDialog):
         """User skipped lyrics search"""
         self.search_skipped.emit()
         self.reject()
+    
+    def done(self, result: int):
+        """Accept/reject: results of a search still in flight are discarded"""
+        self._search_id += 1
+        super().done(result)
@@ -30,6 +30,9 @@ class LyricsSelectorDialog(QDialog):
     selection_cancelled = Signal()
     
     DURATION_TOLERANCE = 2.0  # segundos
+
+    # (theme_version, hoja de estilo) compartido entre instancias
+    _STYLESHEET_CACHE: tuple[int, str] | None = None
     
     def __init__(self, results: list[dict], expected_duration: float = None, parent=None):
         """
@@ -78,6 +81,7 @@ class LyricsSelectorDialog(QDialog):
         
         # Lista de resultados
         self._list_widget = QListWidget()
+        self._list_widget.setObjectName("lyrics_list")
         self._list_widget.setAlternatingRowColors(True)
         layout.addWidget(self._list_widget)
         
@@ -91,10 +95,12 @@ class LyricsSelectorDialog(QDialog):
         buttons_layout.setSpacing(10)
         
         self._cancel_btn = QPushButton("✖ Cancelar")
+        self._cancel_btn.setObjectName("cancel_btn")
         self._cancel_btn.setToolTip("No descargar lyrics")
         self._cancel_btn.setMinimumHeight(36)
         
         self._select_btn = QPushButton("✔ Seleccionar")
+        self._select_btn.setObjectName("select_btn")
         self._select_btn.setToolTip("Descargar lyrics del resultado seleccionado")
         self._select_btn.setMinimumHeight(36)
         self._select_btn.setDefault(True)
@@ -107,6 +113,14 @@ class LyricsSelectorDialog(QDialog):
         
     def _populate_list(self):
         """Llenar lista con resultados formateados"""
+        # Invariantes del bucle: un color y una fuente para todos los matches
+        match_color = StyleManager.get_color("accent_play")
+        match_font = QFont()
+        match_font.setBold(True)
+        select_first = False
+        
+        # Un solo repintado para todo el lote
+        self._list_widget.setUpdatesEnabled(False)
         for idx, result in enumerate(self._results):
             item_text = self._format_result(result)
             item = QListWidgetItem(item_text)
@@ -115,17 +129,20 @@ class LyricsSelectorDialog(QDialog):
             item.setData(Qt.ItemDataRole.UserRole, result)
             
             # Aplicar estilo según tolerancia
-            if self._is_within_tolerance(result):
-                item.setForeground(StyleManager.get_color("accent_play"))
-                font = QFont()
-                font.setBold(True)
-                item.setFont(font)
+            within = self._is_within_tolerance(result)
+            if within:
+                item.setForeground(match_color)
+                item.setFont(match_font)
             
             self._list_widget.addItem(item)
             
-            # Auto-seleccionar el primer match dentro de tolerancia
-            if idx == 0 and self._is_within_tolerance(result):
-                self._list_widget.setCurrentItem(item)
+            if idx == 0:
+                select_first = within
+        self._list_widget.setUpdatesEnabled(True)
+        
+        # Auto-seleccionar el primer resultado si está dentro de tolerancia
+        if select_first:
+            self._list_widget.setCurrentRow(0)
         
     def _format_result(self, result: dict) -> str:
         """
@@ -163,10 +180,23 @@ class LyricsSelectorDialog(QDialog):
     
     def _apply_styles(self):
         """Aplicar estilos consistentes con el tema"""
+        # Una sola hoja a nivel de diálogo; labels, lista y botones la heredan
+        self.setStyleSheet(self._get_stylesheet())
+
+    @classmethod
+    def _get_stylesheet(cls) -> str:
+        """Hoja de estilo del diálogo, construida una vez por versión de tema"""
+        theme_version = StyleManager.theme_version()
+        if cls._STYLESHEET_CACHE is None or cls._STYLESHEET_CACHE[0] != theme_version:
+            cls._STYLESHEET_CACHE = (theme_version, cls._build_stylesheet())
+        return cls._STYLESHEET_CACHE[1]
+
+    @staticmethod
+    def _build_stylesheet() -> str:
+        """Resolver los colores del tema (una vez) y formatear la hoja de estilo"""
         # Background del diálogo
         bg = StyleManager.get_color("bg_base")
-        self.setStyleSheet(f"QDialog {{ background-color: {bg.name()}; }}")
-        
+
         # Colores principales
         text_normal = StyleManager.get_color("text_normal")
         text_dim = StyleManager.get_color("text_dim")
@@ -177,13 +207,12 @@ class LyricsSelectorDialog(QDialog):
         btn_normal = StyleManager.PALETTE["btn_normal"]
         btn_hover = StyleManager.PALETTE["btn_hover"]
         
-        # Labels
-        for label in self.findChildren(QLabel):
-            label.setStyleSheet(f"color: {text_normal.name()};")
-        
-        # ListWidget
-        self._list_widget.setStyleSheet(f"""
-            QListWidget {{
+        return f"""
+            QDialog {{ background-color: {bg.name()}; }}
+            QLabel {{ color: {text_normal.name()}; }}
+
+            /* ListWidget */
+            QListWidget#lyrics_list {{
                 background-color: {bg_workspace.name()};
                 color: {text_normal.name()};
                 border: 1px solid {border_light};
@@ -191,41 +220,36 @@ class LyricsSelectorDialog(QDialog):
                 padding: 5px;
                 outline: none;
             }}
-            QListWidget::item {{
+            QListWidget#lyrics_list::item {{
                 padding: 8px;
                 border-radius: 3px;
             }}
-            QListWidget::item:hover {{
+            QListWidget#lyrics_list::item:hover {{
                 background-color: {bg_panel.name()};
             }}
-            QListWidget::item:selected {{
+            QListWidget#lyrics_list::item:selected {{
                 background-color: {bg_panel.name()};
                 border: 1px solid {accent.name()};
             }}
-            QListWidget::item:selected:hover {{
+            QListWidget#lyrics_list::item:selected:hover {{
                 background-color: rgba(30, 50, 110, 0.8);
             }}
-        """)
-        
-        # Botones
-        self._cancel_btn.setStyleSheet(f"""
-            QPushButton {{
+
+            /* Botones */
+            QPushButton#cancel_btn {{
                 background-color: {btn_normal};
                 color: {text_normal.name()};
                 border: 1px solid {border_light};
                 border-radius: 4px;
                 padding: 8px 16px;
             }}
-            QPushButton:hover {{
+            QPushButton#cancel_btn:hover {{
                 background-color: {btn_hover};
             }}
-            QPushButton:pressed {{
+            QPushButton#cancel_btn:pressed {{
                 background-color: rgba(10, 16, 34, 0.85);
             }}
-        """)
-        
-        self._select_btn.setStyleSheet(f"""
-            QPushButton {{
+            QPushButton#select_btn {{
                 background-color: {btn_normal};
                 color: {accent.name()};
                 border: 1px solid {accent.name()};
@@ -233,21 +257,21 @@ class LyricsSelectorDialog(QDialog):
                 padding: 8px 16px;
                 font-weight: bold;
             }}
-            QPushButton:hover:enabled {{
+            QPushButton#select_btn:hover:enabled {{
                 background-color: {btn_hover};
                 border: 2px solid {accent.name()};
             }}
-            QPushButton:pressed:enabled {{
+            QPushButton#select_btn:pressed:enabled {{
                 background-color: rgba(10, 16, 34, 0.85);
             }}
-            QPushButton:disabled {{
+            QPushButton#select_btn:disabled {{
                 color: {text_dim.name()};
                 border: 1px solid {border_light};
             }}
-            QPushButton:default {{
+            QPushButton#select_btn:default {{
                 border: 2px solid {accent.name()};
             }}
-        """)
+        """
         
     def _connect_signals(self):
         """Conectar señales"""
@@ -18,13 +18,16 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 # Waveform Widget with Zoom, Scroll, and Animated Playhead
 
+import hashlib
+import os
 from enum import Enum, auto
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 import soundfile as sf
-from PySide6.QtCore import QEvent, Qt, Signal
+from PySide6.QtCore import (QEvent, QRunnable, QStandardPaths, QThreadPool, Qt,
+                            Signal)
 from PySide6.QtGui import (QCloseEvent, QColor, QFont, QMouseEvent, QPainter,
                            QPen, QWheelEvent)
 from PySide6.QtWidgets import QWidget
@@ -57,6 +60,79 @@ MAX_ZOOM_LEVEL = 500.0      # Max zoom factor multiplier
 # ===========================================================================
 GLOBAL_DOWNSAMPLE_FACTOR = 4096  # Configurado para i5-2410M (Sandy Bridge)
 
+# Masters at least this long get a mono float32 cache file, built in the
+# background, that later loads memory-map so the whole track is not kept in RAM.
+MEMMAP_MIN_SECONDS = 600.0
+WAVEFORM_CACHE_SUFFIX = '.waveform.f32'
+# Size cap for the cache directory (~10 min of 44.1 kHz audio is ~106 MB);
+# least recently used files go first, which also clears renamed/moved masters
+WAVEFORM_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+# Cache files currently being written (one build per master at a time)
+_CACHE_BUILDS_IN_FLIGHT: set[str] = set()
+
+
+def _waveform_cache_dir() -> Path:
+    """App cache directory for waveform files (never the user's library)."""
+    return Path(QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.CacheLocation)) / 'waveforms'
+
+
+def _waveform_cache_path(master_path: Path) -> Path:
+    key = hashlib.sha1(str(master_path.resolve()).encode('utf-8')).hexdigest()
+    return _waveform_cache_dir() / (key + WAVEFORM_CACHE_SUFFIX)
+
+
+def _prune_waveform_cache(cache_dir: Path, max_bytes: int = WAVEFORM_CACHE_MAX_BYTES) -> None:
+    """Delete the least recently used cache files until the directory fits in max_bytes.
+
+    Cache hits refresh the file's mtime, so mtime order is LRU order.
+    """
+    entries = []
+    for path in cache_dir.glob('*' + WAVEFORM_CACHE_SUFFIX):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries, key=lambda e: e[0]):
+        if total <= max_bytes:
+            break
+        with safe_operation("Evicting waveform cache file", silent=True, log_level="debug"):
+            path.unlink()
+            total -= size
+            logger.debug(f"Waveform cache evicted: {path}")
+
+
+class _WaveformCacheWorker(QRunnable):
+    """Decodes a master block by block into a mono float32 cache file on a pool thread."""
+
+    def __init__(self, master_path: Path, cache_path: Path):
+        super().__init__()
+        self.master_path = master_path
+        self.cache_path = cache_path
+
+    def run(self):
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                for block in sf.blocks(str(self.master_path), blocksize=1 << 16,
+                                       dtype='float32', always_2d=True):
+                    f.write(block.mean(axis=1, dtype=np.float32).tobytes())
+            tmp_path.replace(self.cache_path)
+            logger.debug(f"Waveform cache written: {self.cache_path}")
+            _prune_waveform_cache(self.cache_path.parent)
+        except (OSError, RuntimeError) as e:
+            # Read-only/full disk or a mapped target on Windows: keep using sf.read
+            logger.warning(f"Could not write waveform cache {self.cache_path}: {e}")
+        finally:
+            with safe_operation("Removing waveform cache temp file", silent=True, log_level="debug"):
+                tmp_path.unlink(missing_ok=True)
+            _CACHE_BUILDS_IN_FLIGHT.discard(str(self.cache_path))
+
+
 class ZoomMode(Enum):
     """Tres modos de zoom predefinidos con diferentes comportamientos"""
     GENERAL = auto()    # Vista completa de la forma de onda
@@ -127,7 +203,7 @@ class TimelineView(QWidget):
             self.set_timeline(timeline)
 
         # Initialize all tracks once at construction
-        self._waveform_track = WaveformTrack()
+        self._waveform_track = WaveformTrack(on_envelope_ready=self._request_update)
         self._beat_track = BeatTrack()
         self._chord_track = ChordTrack()
         self._playhead_track = PlayheadTrack()
@@ -180,7 +256,7 @@ class TimelineView(QWidget):
         """Clear cached waveform envelope/rendering in the track (if any)."""
         if getattr(self, '_waveform_track', None) is not None:
             with safe_operation("Resetting waveform cache", silent=True):
-                self._waveform_track.reset_cache()
+                self._waveform_track.invalidate_cache()
 
     def _reset_to_empty_state(self) -> None:
         """Reset timeline to empty state after error or when clearing content.
@@ -331,12 +407,8 @@ class TimelineView(QWidget):
             return
 
         try:
-            # Load audio data
-            audio_data, sample_rate = sf.read(str(master_path), dtype='float32')
-
-            # Convert stereo to mono if needed
-            if audio_data.ndim > 1:
-                audio_data = np.mean(audio_data, axis=1)
+            # Load audio data (mono float32, memory-mapped for long tracks)
+            audio_data, sample_rate = self._load_master_samples(master_path)
 
             # Update state
             self.audio_data = audio_data
@@ -375,6 +447,42 @@ class TimelineView(QWidget):
             logger.error(f"Failed to load audio from {master_path}: {e}")
             self._reset_to_empty_state()
 
+    def _load_master_samples(self, master_path: Path) -> tuple[np.ndarray, int]:
+        """Return mono float32 samples and sample rate for the master track.
+
+        Tracks of MEMMAP_MIN_SECONDS or more are memory-mapped from a mono
+        float32 cache in the app cache directory when a fresh one exists.
+        Otherwise the track is read into memory, and for long tracks the
+        cache is built on a pool thread for the next load.
+        """
+        info = sf.info(str(master_path))
+        if info.duration >= MEMMAP_MIN_SECONDS:
+            cache_path = _waveform_cache_path(master_path)
+            expected_size = info.frames * np.dtype(np.float32).itemsize
+            try:
+                cache_stat = cache_path.stat()
+                if (cache_stat.st_size == expected_size
+                        and cache_stat.st_mtime >= master_path.stat().st_mtime):
+                    audio_data = np.memmap(cache_path, dtype=np.float32, mode='r',
+                                           shape=(info.frames,))
+                    # Mark as recently used for pruning
+                    with safe_operation("Touching waveform cache file", silent=True, log_level="debug"):
+                        os.utime(cache_path)
+                    return audio_data, info.samplerate
+            except OSError:
+                pass  # Missing or unreadable cache: fall back to sf.read
+
+            if str(cache_path) not in _CACHE_BUILDS_IN_FLIGHT:
+                _CACHE_BUILDS_IN_FLIGHT.add(str(cache_path))
+                QThreadPool.globalInstance().start(
+                    _WaveformCacheWorker(master_path, cache_path))
+
+        audio_data, sample_rate = sf.read(str(master_path), dtype='float32')
+        # Convert stereo to mono if needed
+        if audio_data.ndim > 1:
+            audio_data = np.mean(audio_data, axis=1)
+        return audio_data, sample_rate
+
     def has_audio_loaded(self) -> bool:
         """Check if audio data is currently loaded.
 
@@ -407,11 +515,11 @@ class TimelineView(QWidget):
 
     def _clamp_zoom_for_width(self, factor: float, width: int) -> float:
         """Ensure zoom factor keeps samples-per-pixel >= MIN_SAMPLES_PER_PIXEL and within limits."""
-        if self.total_samples == 0 or width <= 0:
+        min_samples_in_view = MIN_SAMPLES_PER_PIXEL * width
+        if self.total_samples == 0 or min_samples_in_view <= 0:
             return max(1.0, min(factor, MAX_ZOOM_LEVEL))
-        max_factor_by_spp = self.total_samples / (MIN_SAMPLES_PER_PIXEL * width)
-        max_allowed = max(1.0, min(MAX_ZOOM_LEVEL, max_factor_by_spp))
-        return max(1.0, min(factor, max_allowed))
+        max_factor_by_spp = self.total_samples / min_samples_in_view
+        return max(1.0, min(factor, MAX_ZOOM_LEVEL, max_factor_by_spp))
 
     def load_metadata(self, meta_data: dict) -> None:
         """Load metadata dictionary and forward to TimelineModel.
@@ -0,0 +1,35 @@
+"""Numba-compiled min/max envelope kernel for WaveformTrack.
+
+Importing this module raises ImportError when numba is not installed;
+WaveformTrack then falls back to its numpy reduceat path.
+"""
+
+from numba import config, njit, prange
+
+# Single-threaded, numpy's reduceat is faster than this kernel; it only pays
+# off when prange can spread bins over several cores.
+MIN_THREADS = 4
+WORTH_USING = config.NUMBA_NUM_THREADS >= MIN_THREADS
+
+
+@njit(cache=True, parallel=True, fastmath=True, boundscheck=False, nogil=True)
+def envelope_minmax(samples, edges, mins, maxs):
+    """Fill ``mins``/``maxs`` with the min/max of each bin ``[edges[i], edges[i+1])``.
+
+    Bins are reduced in parallel and each sample is read once. An empty bin
+    takes the value of ``samples[edges[i]]``, like ``np.minimum.reduceat``.
+    """
+    for i in prange(edges.shape[0] - 1):
+        s = edges[i]
+        e = edges[i + 1]
+        if e <= s:
+            e = s + 1
+        mn = samples[s]
+        mx = mn
+        for k in range(s + 1, e):
+            # Branch-free so LLVM can vectorize the inner reduction
+            v = samples[k]
+            mn = min(mn, v)
+            mx = max(mx, v)
+        mins[i] = mn
+        maxs[i] = mx
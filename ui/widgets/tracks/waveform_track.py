@@ -1,30 +1,124 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
 import numpy as np
+from PySide6.QtCore import QObject, Signal, Slot
 from PySide6.QtGui import QPainter, QColor, QPen
 
+try:
+    # Optional JIT kernel: multi-core, single-pass min/max per bin
+    from ui.widgets.tracks._envelope_kernel import envelope_minmax, WORTH_USING
+    NUMBA_KERNEL_AVAILABLE = WORTH_USING
+except ImportError:
+    NUMBA_KERNEL_AVAILABLE = False
+
 from ui.widgets.tracks.beat_track import ViewContext
 from ui.styles import StyleManager
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# The parallel kernel runs on both the envelope worker and the UI thread;
+# numba's workqueue threading layer aborts on concurrent parallel regions
+_PARALLEL_KERNEL_LOCK = threading.Lock()
+
+
+class _EnvelopeSignals(QObject):
+    """Carries envelopes computed on the worker thread back to the UI thread.
+
+    ``ready`` is emitted from the pool thread; since this object lives in the
+    UI thread, the connection to ``_deliver`` is queued by Qt.
+    """
+    ready = Signal(object, object, int)  # key, (mins, maxs), generation
+
+    def __init__(self, track: "WaveformTrack") -> None:
+        super().__init__()
+        self._track = track
+        self.ready.connect(self._deliver)
+
+    @Slot(object, object, int)
+    def _deliver(self, key, envelope, generation: int) -> None:
+        self._track._handle_envelope_ready(key, envelope, generation)
 
 
 class WaveformTrack:
     """Renders the audio waveform using a cached envelope per paint call.
 
     Stateless aside from an internal render cache keyed by (start, end, width).
+    Windows of ASYNC_MIN_SAMPLES or more are reduced on a background thread
+    so a full-track recompute does not stall the UI; see
+    ``_compute_envelope_async``.
     """
 
-    def __init__(self) -> None:
+    EDGES_CACHE_SIZE = 4
+    # Window length (after downsampling) from which paint() computes off-thread
+    ASYNC_MIN_SAMPLES = 2_000_000
+
+    # One shared worker: numpy/numba release the GIL inside the reductions
+    _pool: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self, on_envelope_ready: Optional[Callable[[], None]] = None) -> None:
         self._last_params = None  # (start, end, width)
         self._last_envelope = None  # (mins, maxs)
+        self._edges_cache: dict[tuple[int, int], np.ndarray] = {}  # (L, width) -> bin edges
+        self._edges_lock = threading.Lock()  # _get_edges runs on both threads
         self.pen_waveform = QPen(StyleManager.get_color("waveform"), 1)
 
-    def reset_cache(self) -> None:
-        self._last_params = None
-        self._last_envelope = None
+        # Async envelope state (UI thread only)
+        self._ready_callback = on_envelope_ready  # e.g. widget repaint request
+        self._signals = _EnvelopeSignals(self)
+        self._pending_key = None
+        self._generation = 0  # bumped on invalidate; stale results are dropped
+
+    def invalidate_cache(self) -> None:
+        """Drop every render cache (envelope and bin edges) in one place."""
+        self._last_params = self._last_envelope = None
+        with self._edges_lock:
+            self._edges_cache.clear()
+        self._generation += 1
+
+    def _get_edges(self, L: int, w: int) -> np.ndarray:
+        """Return the ``w + 1`` bin edges over ``L`` samples, reusing recent arrays.
+
+        While scrolling, width and window length rarely change even though
+        start/end do, so the same edges serve many consecutive redraws.
+        """
+        key = (L, w)
+        with self._edges_lock:
+            edges = self._edges_cache.get(key)
+            if edges is None:
+                if len(self._edges_cache) >= self.EDGES_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del self._edges_cache[next(iter(self._edges_cache))]
+                # Exact integer floor(i * L / w); no float64 linspace + cast
+                edges = (np.arange(w + 1, dtype=np.intp) * L) // w
+                self._edges_cache[key] = edges
+        return edges
 
     def _compute_envelope(self, samples: np.ndarray, start: int, end: int, w: int, zoom_factor=None, downsample_factor=None):
+        """Return ``(mins, maxs)`` for the window, one value per pixel column.
+
+        The cache check comes first so steady-state repaints do no numpy
+        work. The cached arrays are returned by reference and are marked
+        read-only; callers must not modify them.
+        """
         key = (start, end, w, zoom_factor, downsample_factor)
+        # Plain tuple equality is the cheapest hit test: comparing a stored
+        # hash first measured ~2x slower, since hash(key) visits every field
         if self._last_params == key and self._last_envelope is not None:
             return self._last_envelope
 
+        self._last_params = key
+        self._last_envelope = self._build_envelope(samples, start, end, w, downsample_factor)
+        return self._last_envelope
+
+    def _build_envelope(self, samples: np.ndarray, start: int, end: int, w: int, downsample_factor=None):
+        """Reduce ``samples[start:end + 1]`` to ``w`` read-only (mins, maxs) columns.
+
+        Touches no render state other than the locked edges cache, so it is
+        safe to run on the envelope worker thread.
+        """
         window = samples[start:end + 1]
         L = len(window)
         
@@ -39,30 +133,80 @@ class WaveformTrack:
             mins = np.zeros(w, dtype=np.float32)
             maxs = np.zeros(w, dtype=np.float32)
         elif L < w:
-            indices = np.linspace(0, L - 1, num=w)
-            interp = np.interp(indices, np.arange(L), window)
-            mins = interp.astype(np.float32)
-            maxs = interp.astype(np.float32)
+            # Linear interpolation on a uniform grid: a direct gather + lerp
+            # instead of np.interp's general breakpoint search.
+            if L == 1:
+                interp = np.full(w, window[0], dtype=np.float32)
+            else:
+                idx = np.arange(w) * ((L - 1) / (w - 1))
+                i0 = np.minimum(idx.astype(np.intp), L - 2)
+                left = window[i0]
+                interp = (left + (window[i0 + 1] - left) * (idx - i0)).astype(np.float32)
+            # min == max on this path, both share the same array
+            mins = interp
+            maxs = interp
         else:
-            edges = np.linspace(0, L, num=w + 1, dtype=int)
-            mins = np.empty(w, dtype=np.float32)
-            maxs = np.empty(w, dtype=np.float32)
-            for i in range(w):
-                s = edges[i]
-                e = edges[i + 1]
-                if e <= s:
-                    v = float(window[min(s, L - 1)])
-                    mins[i] = v
-                    maxs[i] = v
-                else:
-                    block = window[s:e]
-                    mins[i] = float(np.min(block))
-                    maxs[i] = float(np.max(block))
+            # Reduce all bins in a single ufunc call instead of a Python loop.
+            # With L >= w no bin is empty (reduceat would yield window[s]).
+            edges = self._get_edges(L, w)
+            if NUMBA_KERNEL_AVAILABLE:
+                mins = np.empty(w, dtype=np.float32)
+                maxs = np.empty(w, dtype=np.float32)
+                with _PARALLEL_KERNEL_LOCK:
+                    envelope_minmax(window, edges, mins, maxs)
+            else:
+                mins = np.minimum.reduceat(window, edges[:-1]).astype(np.float32, copy=False)
+                maxs = np.maximum.reduceat(window, edges[:-1]).astype(np.float32, copy=False)
 
-        self._last_params = key
-        self._last_envelope = (mins, maxs)
+        mins.setflags(write=False)
+        maxs.setflags(write=False)
         return mins, maxs
 
+    def _compute_envelope_async(self, samples: np.ndarray, start: int, end: int, w: int, zoom_factor=None, downsample_factor=None):
+        """Non-blocking variant of ``_compute_envelope``.
+
+        Returns the cached envelope on a hit. On a miss it schedules the
+        reduction on the worker thread (at most one in flight) and returns
+        None; when the result arrives on the UI thread it is cached and
+        ``on_envelope_ready`` is called so the widget repaints.
+        """
+        key = (start, end, w, zoom_factor, downsample_factor)
+        if self._last_params == key and self._last_envelope is not None:
+            return self._last_envelope
+        if self._pending_key is not None:
+            # Busy: the repaint after the in-flight job will request this key
+            return None
+
+        if WaveformTrack._pool is None:
+            WaveformTrack._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='envelope')
+
+        self._pending_key = key
+        generation = self._generation
+        signals = self._signals
+
+        def job():
+            try:
+                envelope = self._build_envelope(samples, start, end, w, downsample_factor)
+            except Exception as e:
+                logger.error(f"Background envelope computation failed: {e}", exc_info=True)
+                envelope = None
+            signals.ready.emit(key, envelope, generation)
+
+        WaveformTrack._pool.submit(job)
+        return None
+
+    def _handle_envelope_ready(self, key, envelope, generation: int) -> None:
+        """UI-thread completion of ``_compute_envelope_async``."""
+        self._pending_key = None
+        if envelope is None:
+            # Failed job (already logged); don't trigger a repaint that would retry it
+            return
+        if generation == self._generation:
+            self._last_params = key
+            self._last_envelope = envelope
+        if self._ready_callback is not None:
+            self._ready_callback()
+
     def paint(self, painter: QPainter, ctx: ViewContext, samples: np.ndarray, downsample_factor=None) -> None:
         """Draw waveform envelope for the current viewport.
         
@@ -81,7 +225,19 @@ class WaveformTrack:
             
             painter.setPen(self.pen_waveform)
 
-            mins, maxs = self._compute_envelope(samples, ctx.start_sample, ctx.end_sample, w, None, downsample_factor)
+            window_len = ctx.end_sample - ctx.start_sample + 1
+            if downsample_factor and downsample_factor > 1:
+                window_len //= downsample_factor
+            if window_len >= self.ASYNC_MIN_SAMPLES and self._ready_callback is not None:
+                envelope = self._compute_envelope_async(samples, ctx.start_sample, ctx.end_sample, w, None, downsample_factor)
+                if envelope is None:
+                    # Keep showing the previous envelope while the new one is computed
+                    envelope = self._last_envelope
+                    if envelope is None or len(envelope[0]) != w:
+                        return
+            else:
+                envelope = self._compute_envelope(samples, ctx.start_sample, ctx.end_sample, w, None, downsample_factor)
+            mins, maxs = envelope
             for x in range(w):
                 y1 = int(mins[x] * (h / 2 - 2))
                 y2 = int(maxs[x] * (h / 2 - 2))
@@ -1,5 +1,7 @@
 from PySide6.QtCore import QPoint
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QLayout, QMenu, QWidget
+from functools import lru_cache
 from pathlib import Path
 import os
 import math 
@@ -31,6 +33,16 @@ def clear_layout(layout: QLayout) -> None:
             clear_layout(item.layout())
 
 
+@lru_cache(maxsize=None)
+def get_icon(path: str) -> QIcon:
+    """Return a shared QIcon for ``path``, decoding the file only once.
+
+    Widgets that swap icons on every toggle (play/pause, cast) reuse the
+    same instance, so Qt's pixmap cache also hits across widgets.
+    """
+    return QIcon(path)
+
+
 def clamp_menu_to_window(menu: QMenu, desired_pos: QPoint, window: QWidget) -> QPoint:
     """
     ajusta un Qmenu para que no se salga de la ventana principal
@@ -257,9 +269,13 @@ def format_time(seconds: Optional[float]) -> str:
         return "00:00"
     
     # Redondear al segundo más cercano para un formato simple
-    total_seconds = int(round(seconds))
-    
+    return _format_whole_seconds(int(round(seconds)))
+
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(total_seconds: int) -> str:
+    """MM:SS de un entero; cacheado porque los ticks repiten el mismo segundo."""
     minutes = total_seconds // 60
     secs = total_seconds % 60
-    
-    return f"{minutes:02d}:{secs:02d}"
\ No newline at end of file
+
+    return f"{minutes:02d}:{secs:02d}"
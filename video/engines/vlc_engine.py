@@ -17,6 +17,18 @@ from video.engines.base import VisualEngine, PlaybackState
 
 logger = get_logger(__name__)
 
+# VLC args - CRITICAL: '--no-audio' to prevent VLC from emitting sound
+# AudioEngine is the sole owner of audio output
+_VLC_ARGS_NORMAL = ('--quiet', '--no-video-title-show', '--log-verbose=2', '--no-audio')
+
+# Optimizations for legacy CPUs (Sandy Bridge, Core 2 Duo, etc.)
+_VLC_ARGS_LEGACY = _VLC_ARGS_NORMAL + (
+    '--avcodec-hurry-up',         # Skip frames if CPU slow
+    '--avcodec-skiploopfilter=4', # Skip deblocking (less CPU)
+    '--avcodec-threads=2',        # Limit threads (leave for audio)
+    '--file-caching=1000',        # Larger buffer (reduce spikes)
+)
+
 
 class VlcEngine(VisualEngine):
     """
@@ -58,23 +70,15 @@ class VlcEngine(VisualEngine):
         Raises:
             RuntimeError: If VLC initialization failed
         """
-        # VLC args - CRITICAL: '--no-audio' to prevent VLC from emitting sound
-        # AudioEngine is the sole owner of audio output
-        vlc_args = ['--quiet', '--no-video-title-show', '--log-verbose=2', '--no-audio']
-
         if self.is_legacy_hardware:
-            # Optimizations for legacy CPUs (Sandy Bridge, Core 2 Duo, etc.)
-            vlc_args.extend([
-                '--avcodec-hurry-up',         # Skip frames if CPU slow
-                '--avcodec-skiploopfilter=4', # Skip deblocking (less CPU)
-                '--avcodec-threads=2',        # Limit threads (leave for audio)
-                '--file-caching=1000',        # Larger buffer (reduce spikes)
-            ])
+            vlc_args = _VLC_ARGS_LEGACY
             logger.info("🔧 VlcEngine: Legacy hardware optimizations enabled")
+        else:
+            vlc_args = _VLC_ARGS_NORMAL
 
         # Initialize VLC instance and player
         try:
-            self.instance = vlc.Instance(vlc_args)
+            self.instance = vlc.Instance(list(vlc_args))
             self.player = self.instance.media_player_new()
             # Audio muted via --no-audio arg (no need for audio_set_mute)
 